@@ -10,9 +10,12 @@ class Settings(BaseSettings):
     serpapi_key: str = ""  # Set via SERPAPI_KEY env var
     brand_name: str = "STRUCTURE"
     deduplication_window: int = 30
+    curated_first_prob: float = 0.3  # Share of topic discoveries served from curated topics before SerpAPI
     
     # Neon PostgreSQL database
     database_url: str = ""  # Set via DATABASE_URL env var
+    db_pool_size: int = 10  # Keep pool + overflow under Postgres max_connections
+    db_max_overflow: int = 5
     
     # Instagram API
     instagram_app_id: str = ""  # Set via INSTAGRAM_APP_ID env var
@@ -43,6 +46,8 @@ class Settings(BaseSettings):
     
     host: str = "0.0.0.0"
     port: int = 8000
+    log_level: str = "INFO"  # Set via LOG_LEVEL env var
+    env: str = "development"  # Set via ENV env var ("development" or "production")
 
     class Config:
         env_file = ".env"
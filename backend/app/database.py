@@ -23,10 +23,10 @@ def get_engine():
         try:
             _engine = create_async_engine(
                 settings.database_url,
-                echo=True,
                 pool_pre_ping=True,
-                pool_size=3,
-                max_overflow=5,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                pool_recycle=1800,  # Recycle before Neon drops idle connections
             )
             print(f"✓ Database engine created for: {settings.database_url[:50]}...")
         except Exception as e:
@@ -83,6 +83,8 @@ async def init_db():
                 "ALTER TABLE scheduled_posts ADD COLUMN IF NOT EXISTS instagram_post_id VARCHAR(100);",
                 "ALTER TABLE scheduled_posts ADD COLUMN IF NOT EXISTS error_message TEXT;",
                 "ALTER TABLE scheduled_posts ADD COLUMN IF NOT EXISTS posted_at TIMESTAMP WITH TIME ZONE;",
+                # UsedTopic dedup window lookups
+                "CREATE INDEX IF NOT EXISTS ix_used_topics_created_at ON used_topics (created_at);",
             ]
             
             from sqlalchemy import text
@@ -1,10 +1,33 @@
 """FastAPI app with API routes and frontend"""
+import logging
+import logging.handlers
+import queue
 from fastapi import FastAPI
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from pathlib import Path
+from app.config import get_settings
+
+# Log records are handed to a queue and written by a listener thread,
+# so handlers never block the event loop on stdout.
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    '%(asctime)s %(levelname)s %(name)s: %(message)s',
+    datefmt='%H:%M:%S'
+))
+log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+logging.basicConfig(
+    level=get_settings().log_level.upper(),
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
+log_listener.start()
+# SQL statements go through the queue too, and only when LOG_LEVEL=DEBUG
+logging.getLogger("sqlalchemy.engine").setLevel(
+    logging.INFO if logging.getLogger().level <= logging.DEBUG else logging.WARNING
+)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -39,6 +62,13 @@ async def lifespan(app: FastAPI):
         stop_scheduler()
     except:
         pass
+    try:
+        from app.services import social_posting, topic_discovery
+        await social_posting.close_http_client()
+        await topic_discovery.close_http_client()
+    except Exception:
+        pass
+    log_listener.stop()
 
 app = FastAPI(lifespan=lifespan)
 
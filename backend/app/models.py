@@ -29,7 +29,7 @@ class UsedTopic(Base):
     id = Column(Integer, primary_key=True, index=True)
     topic = Column(String(500), nullable=False, index=True)
     post_id = Column(Integer, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
 
 class ScheduledPost(Base):
@@ -1,6 +1,7 @@
 """API routes for video clipper and captioner."""
 
 import asyncio
+import gzip
 import json
 import logging
 import os
@@ -13,7 +14,7 @@ from pathlib import Path
 from typing import Optional, List, Dict
 from datetime import datetime
 
-from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks, Form
+from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks, Form, Request
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
@@ -860,14 +861,15 @@ async def register_worker(data: dict):
     return {"status": "registered", "worker_id": worker_id}
 
 
-@router.get("/worker/jobs/pending")
-async def get_pending_worker_job(worker_id: str = None):
-    """Get a pending job for a local worker to process."""
-    if worker_id and worker_id in _registered_workers:
-        _registered_workers[worker_id]["last_seen"] = datetime.now().isoformat()
-    
-    # Find a job that needs worker processing
-    for job_id, progress in _job_progress.items():
+# Longest a worker's pending-job request is held open waiting for work
+WORKER_LONG_POLL_MAX = 25.0
+WORKER_LONG_POLL_INTERVAL = 0.5
+
+
+def _claim_worker_job(worker_id: Optional[str]) -> Optional[dict]:
+    """Claim the first job waiting for a local worker, if any."""
+    # Find a job that needs worker processing (snapshot - pipeline threads add jobs concurrently)
+    for job_id, progress in list(_job_progress.items()):
         # Check for smart jobs ready for worker (download complete)
         if progress.get("mode") == "smart" and progress["status"] == "ready_for_worker":
             # Claim this job
@@ -879,12 +881,10 @@ async def get_pending_worker_job(worker_id: str = None):
             add_job_log(job_id, f"Job claimed by worker: {worker_id}")
             
             return {
-                "job": {
-                    "job_id": job_id,
-                    "job_type": "smart",  # Smart job = transcribe + analyze + render
-                    "video_url": config.get("video_url"),
-                    "config": config.get("config", {}),
-                }
+                "job_id": job_id,
+                "job_type": "smart",  # Smart job = transcribe + analyze + render
+                "video_url": config.get("video_url"),
+                "config": config.get("config", {}),
             }
         
         # Check for legacy worker mode jobs
@@ -897,17 +897,34 @@ async def get_pending_worker_job(worker_id: str = None):
             config = _worker_job_configs.get(job_id, {})
             
             return {
-                "job": {
-                    "job_id": job_id,
-                    "job_type": "render",  # Just render pre-selected clips
-                    "video_url": config.get("video_url"),
-                    "youtube_url": config.get("youtube_url"),
-                    "config": config.get("pipeline_config", config.get("config", {})),
-                    "selected_clips": config.get("selected_clips"),
-                }
+                "job_id": job_id,
+                "job_type": "render",  # Just render pre-selected clips
+                "video_url": config.get("video_url"),
+                "youtube_url": config.get("youtube_url"),
+                "config": config.get("pipeline_config", config.get("config", {})),
+                "selected_clips": config.get("selected_clips"),
             }
     
-    return {"job": None}
+    return None
+
+
+@router.get("/worker/jobs/pending")
+async def get_pending_worker_job(worker_id: str = None, wait: float = 0):
+    """
+    Get a pending job for a local worker to process.
+    
+    With wait > 0 this long-polls: the request is held (up to WORKER_LONG_POLL_MAX
+    seconds) until a job is ready, so idle workers don't need to re-poll.
+    """
+    if worker_id and worker_id in _registered_workers:
+        _registered_workers[worker_id]["last_seen"] = datetime.now().isoformat()
+    
+    deadline = asyncio.get_running_loop().time() + min(max(wait, 0), WORKER_LONG_POLL_MAX)
+    while True:
+        job = _claim_worker_job(worker_id)
+        if job or asyncio.get_running_loop().time() >= deadline:
+            return {"job": job}
+        await asyncio.sleep(WORKER_LONG_POLL_INTERVAL)
 
 
 @router.post("/worker/jobs/{job_id}/progress")
@@ -931,12 +948,23 @@ async def update_worker_job_progress(job_id: str, data: dict):
     return {"status": "ok", "should_stop": False}
 
 
+async def _worker_json_body(request: Request) -> dict:
+    """Decode a worker's JSON request body, which may be gzipped (Content-Encoding: gzip)."""
+    body = await request.body()
+    if request.headers.get("content-encoding") == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body)
+
+
 @router.post("/worker/jobs/{job_id}/candidates")
-async def upload_worker_candidates(job_id: str, data: dict):
+async def upload_worker_candidates(job_id: str, request: Request):
     """Receive viral candidates from local worker after transcription + analysis."""
     if job_id not in _job_progress:
         raise HTTPException(status_code=404, detail="Job not found")
     
+    # Workers gzip this payload (word-level transcripts are large)
+    data = await _worker_json_body(request)
+    
     candidates = data.get("candidates", [])
     transcript = data.get("transcript", {})
     
@@ -986,9 +1014,10 @@ async def upload_worker_clip(
     
     clip_path = job_dir / f"clip_{index:02d}.mp4"
     
+    # Copy in chunks so large clips are never held in memory
     with open(clip_path, "wb") as f:
-        content = await file.read()
-        f.write(content)
+        while chunk := await file.read(1024 * 1024):
+            f.write(chunk)
     
     logger.info(f"Worker uploaded clip {index} for job {job_id}")
     
@@ -1000,11 +1029,12 @@ async def upload_worker_clip(
 
 
 @router.post("/worker/jobs/{job_id}/complete")
-async def complete_worker_job(job_id: str, data: dict):
+async def complete_worker_job(job_id: str, request: Request):
     """Mark a worker job as complete."""
     if job_id not in _job_progress:
         raise HTTPException(status_code=404, detail="Job not found")
     
+    data = await _worker_json_body(request)
     success = data.get("success", False)
     error = data.get("error")
     clips_count = data.get("clips_count", 0)
@@ -2830,11 +2860,11 @@ async def post_to_instagram(
     category: str = Form("default"),
 ):
     """Post a clip to Instagram Reels."""
-    from ..social_posting import SocialMediaManager
+    from ..social_posting import get_social_manager
     from ...config import get_settings
     
     settings = get_settings()
-    manager = SocialMediaManager(settings)
+    manager = get_social_manager(settings)
     
     # If video_url not provided, construct from job_id
     if not video_url and job_id:
@@ -2862,11 +2892,11 @@ async def post_to_tiktok(
     category: str = Form("default"),
 ):
     """Post a clip to TikTok."""
-    from ..social_posting import SocialMediaManager
+    from ..social_posting import get_social_manager
     from ...config import get_settings
     
     settings = get_settings()
-    manager = SocialMediaManager(settings)
+    manager = get_social_manager(settings)
     
     # If video_url not provided, construct from job_id
     if not video_url and job_id:
@@ -2893,11 +2923,11 @@ async def post_to_youtube(
     category: str = Form("default"),
 ):
     """Post a clip to YouTube Shorts."""
-    from ..social_posting import SocialMediaManager
+    from ..social_posting import get_social_manager
     from ...config import get_settings
     
     settings = get_settings()
-    manager = SocialMediaManager(settings)
+    manager = get_social_manager(settings)
     
     if not job_id:
         return {"success": False, "error": "Job ID required for YouTube upload"}
@@ -2924,11 +2954,11 @@ async def post_to_all_platforms(
     category: str = Form("default"),
 ):
     """Post a clip to all configured platforms (Instagram, TikTok, YouTube)."""
-    from ..social_posting import SocialMediaManager
+    from ..social_posting import get_social_manager
     from ...config import get_settings
     
     settings = get_settings()
-    manager = SocialMediaManager(settings)
+    manager = get_social_manager(settings)
     
     if not job_id:
         return {"success": False, "error": "Job ID required"}
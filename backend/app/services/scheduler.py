@@ -3,6 +3,7 @@ Background scheduler for auto-posting to Instagram.
 """
 
 import asyncio
+import logging
 import os
 from datetime import datetime, timezone, timedelta
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -23,29 +24,55 @@ from app.config import get_settings
 import random
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 scheduler = AsyncIOScheduler()
 
 # Base URL for images - use environment variable or default
 BASE_URL = os.environ.get("PUBLIC_URL", "https://instagramposting-production-4e91.up.railway.app")
 
+# Directory the posters read rendered slides from
+_IMG_DIR = "backend/generated_images/"
+
+# Choices for "random" carousel settings, computed once at import
+_TEMPLATE_IDS = tuple(t["id"] for t in get_all_templates())
+_COLOR_THEME_IDS = tuple(c["id"] for c in list_color_themes())
+_TEXTURE_IDS = tuple(t["id"] for t in list_textures())
+_NON_CENTERED_LAYOUTS = tuple(l["id"] for l in list_layouts() if l["id"] != "centered")
+
+# Primary key of the AutoPostSettings row, learned on the first lookup
+_settings_row_id = None
+
+
+async def _get_singleton_settings(db: AsyncSession):
+    """Fetch the single AutoPostSettings row, by primary key once its id is known."""
+    global _settings_row_id
+    if _settings_row_id is not None:
+        auto_settings = await db.get(AutoPostSettings, _settings_row_id)
+        if auto_settings:
+            return auto_settings
+    
+    result = await db.execute(select(AutoPostSettings).limit(1))
+    auto_settings = result.scalar_one_or_none()
+    _settings_row_id = auto_settings.id if auto_settings else None
+    return auto_settings
+
 
 async def check_and_post_scheduled():
     """Check for scheduled posts that are due and post them."""
-    print(f"[Scheduler] Checking at {datetime.now(timezone.utc)}")
+    logger.info(f"Checking at {datetime.now(timezone.utc)}")
     
     session_maker = get_session_maker()
     if not session_maker:
-        print("[Scheduler] Database not available")
+        logger.warning("Database not available")
         return
     
     async with session_maker() as db:
         try:
             # Get auto-post settings
-            result = await db.execute(select(AutoPostSettings).limit(1))
-            auto_settings = result.scalar_one_or_none()
+            auto_settings = await _get_singleton_settings(db)
             
             if not auto_settings or not auto_settings.enabled:
-                print("[Scheduler] Auto-posting is disabled")
+                logger.info("Auto-posting is disabled")
                 return
             
             now = datetime.now(timezone.utc)
@@ -64,7 +91,7 @@ async def check_and_post_scheduled():
             
             # Only auto-generate if NO posts exist for today (pending, posted, or failed)
             if not today_posts:
-                print("[Scheduler] No posts scheduled for today - generating queue")
+                logger.info("No posts scheduled for today - generating queue")
                 await auto_generate_daily_queue(db, auto_settings)
                 await db.commit()
             
@@ -83,28 +110,39 @@ async def check_and_post_scheduled():
             due_post = result.scalar_one_or_none()
             
             if not due_post:
-                print("[Scheduler] No posts due right now (or all locked)")
+                logger.info("No posts due right now (or all locked)")
                 return
             
             # Immediately update status to prevent ANY chance of reprocessing
             post_id = due_post.id
             post_type = due_post.post_type or "carousel"
             
-            print(f"[Scheduler] LOCKED post {post_id} (type: {post_type}) scheduled for {due_post.scheduled_time}")
+            logger.info(f"LOCKED post {post_id} (type: {post_type}) scheduled for {due_post.scheduled_time}")
             
             # Update status FIRST before any processing
             due_post.status = "processing"
             await db.commit()
-            print(f"[Scheduler] Marked post {post_id} as PROCESSING")
+            logger.info(f"Marked post {post_id} as PROCESSING")
             
             # Now process (status is already saved)
             await process_scheduled_post(db, due_post, auto_settings)
-            print(f"[Scheduler] Finished processing post {post_id}")
+            logger.info(f"Finished processing post {post_id}")
                 
         except Exception as e:
-            print(f"[Scheduler] Error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Error: {e}")
+
+
+def build_daily_schedule(day_start: datetime, carousel_count: int, news_count: int) -> list:
+    """Build (scheduled_time, post_type) slots spread evenly over the day.
+    
+    Post types are shuffled; the first slot is at half an interval, then one every interval.
+    """
+    post_types = ["carousel"] * carousel_count + ["news"] * news_count
+    slot_seconds = 86400 / len(post_types)
+    return [
+        (day_start + timedelta(seconds=slot_seconds * (i + 0.5)), post_type)
+        for i, post_type in enumerate(random.sample(post_types, len(post_types)))
+    ]
 
 
 async def auto_generate_daily_queue(db: AsyncSession, auto_settings: AutoPostSettings):
@@ -119,34 +157,22 @@ async def auto_generate_daily_queue(db: AsyncSession, auto_settings: AutoPostSet
     total_posts = carousel_count + news_count
     
     if total_posts == 0:
-        print("[Scheduler] No posts configured - carousel_count and news_count both 0")
+        logger.info("No posts configured - carousel_count and news_count both 0")
         return
     
     now = datetime.now(timezone.utc)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     
-    # Calculate interval between posts (spread over 24 hours)
-    interval_hours = 24.0 / total_posts
+    schedule = build_daily_schedule(today_start, carousel_count, news_count)
     
-    # Build a list of post types to create
-    post_types = ["carousel"] * carousel_count + ["news"] * news_count
-    
-    # Shuffle to mix carousel and news throughout the day
-    random.shuffle(post_types)
+    # Skip times that have already passed
+    upcoming = [(t, post_type) for t, post_type in schedule if t >= now]
+    if len(upcoming) < len(schedule):
+        logger.info(f"Skipping {len(schedule) - len(upcoming)} past time slots")
     
     created_count = 0
     
-    for i, post_type in enumerate(post_types):
-        # Calculate scheduled time - evenly spread throughout the day
-        # First post at interval_hours/2, then every interval_hours after
-        hours_offset = (interval_hours * i) + (interval_hours / 2)
-        scheduled_time = today_start + timedelta(hours=hours_offset)
-        
-        # Skip times that have already passed
-        if scheduled_time < now:
-            print(f"[Scheduler] Skipping past time: {scheduled_time}")
-            continue
-        
+    for scheduled_time, post_type in upcoming:
         if post_type == "carousel":
             # Carousel post settings
             template_id = auto_settings.default_template_id or "random"
@@ -191,15 +217,15 @@ async def auto_generate_daily_queue(db: AsyncSession, auto_settings: AutoPostSet
         
         db.add(scheduled_post)
         created_count += 1
-        print(f"[Scheduler] Scheduled {post_type} post for {scheduled_time}")
+        logger.info(f"Scheduled {post_type} post for {scheduled_time}")
     
     await db.commit()
-    print(f"[Scheduler] Auto-generated {created_count} posts spread over 24 hours")
+    logger.info(f"Auto-generated {created_count} posts spread over 24 hours")
 
 
 async def process_scheduled_post(db: AsyncSession, scheduled: ScheduledPost, auto_settings: AutoPostSettings):
     """Process a single scheduled post. Post should already be marked as 'processing'."""
-    print(f"[Scheduler] Processing scheduled post {scheduled.id} (type: {getattr(scheduled, 'post_type', 'carousel')})")
+    logger.info(f"Processing scheduled post {scheduled.id} (type: {getattr(scheduled, 'post_type', 'carousel')})")
     
     try:
         # Check if post already exists
@@ -213,7 +239,7 @@ async def process_scheduled_post(db: AsyncSession, scheduled: ScheduledPost, aut
         
         # Generate post if needed
         if not post:
-            print(f"[Scheduler] Generating new post for scheduled {scheduled.id}")
+            logger.info(f"Generating new post for scheduled {scheduled.id}")
             post = await generate_post_for_schedule(db, scheduled, auto_settings)
             if not post:
                 scheduled.status = "failed"
@@ -235,11 +261,10 @@ async def process_scheduled_post(db: AsyncSession, scheduled: ScheduledPost, aut
                 return
             
             # Handle both old format (generated_images/file.png) and new format (file.png)
-            filename = os.path.basename(post.slide_1_image)
-            image_path = f"backend/generated_images/{filename}"
-            print(f"[Scheduler] News image path: {image_path}")
+            image_path = _IMG_DIR + os.path.basename(post.slide_1_image)
+            logger.info(f"News image path: {image_path}")
             
-            print(f"[Scheduler] Posting news to Instagram...")
+            logger.info(f"Posting news to Instagram...")
             result = await post_single_image_to_instagram(
                 image_path=image_path,
                 caption=post.caption,
@@ -249,24 +274,24 @@ async def process_scheduled_post(db: AsyncSession, scheduled: ScheduledPost, aut
             )
         else:
             # Carousel post - collect all image paths
-            image_paths = []
-            for img in [post.slide_1_image, post.slide_2_image, post.slide_3_image, post.slide_4_image]:
-                if img:
-                    # Handle both old format (generated_images/file.png) and new format (file.png)
-                    filename = os.path.basename(img)
-                    image_paths.append(f"backend/generated_images/{filename}")
+            # Handle both old format (generated_images/file.png) and new format (file.png)
+            image_paths = [
+                _IMG_DIR + os.path.basename(img)
+                for img in (post.slide_1_image, post.slide_2_image, post.slide_3_image, post.slide_4_image)
+                if img
+            ]
             
             # Add extra slides from metadata (slides 5+)
             if post.metadata_json and "extra_images" in post.metadata_json:
                 extra_images = post.metadata_json["extra_images"]
                 slide_count = post.metadata_json.get("slide_count", 4)
-                for i in range(5, slide_count + 1):
-                    img_key = f"slide_{i}_image"
-                    if img_key in extra_images and extra_images[img_key]:
-                        filename = os.path.basename(extra_images[img_key])
-                        image_paths.append(f"backend/generated_images/{filename}")
+                image_paths.extend(
+                    _IMG_DIR + os.path.basename(img)
+                    for i in range(5, slide_count + 1)
+                    if (img := extra_images.get(f"slide_{i}_image"))
+                )
             
-            print(f"[Scheduler] Carousel has {len(image_paths)} images: {image_paths[:2]}...")
+            logger.info(f"Carousel has {len(image_paths)} images: {image_paths[:2]}...")
             
             if len(image_paths) < 2:
                 scheduled.status = "failed"
@@ -275,7 +300,7 @@ async def process_scheduled_post(db: AsyncSession, scheduled: ScheduledPost, aut
                 return
             
             # Post to Instagram
-            print(f"[Scheduler] Posting carousel to Instagram...")
+            logger.info(f"Posting carousel to Instagram...")
             result = await post_carousel_to_instagram(
                 image_paths=image_paths,
                 caption=post.caption,
@@ -288,16 +313,16 @@ async def process_scheduled_post(db: AsyncSession, scheduled: ScheduledPost, aut
             scheduled.status = "posted"
             scheduled.instagram_post_id = result.get("instagram_post_id")
             scheduled.posted_at = datetime.now(timezone.utc)
-            print(f"[Scheduler] Successfully posted! IG ID: {scheduled.instagram_post_id}")
+            logger.info(f"Successfully posted! IG ID: {scheduled.instagram_post_id}")
         else:
             scheduled.status = "failed"
             scheduled.error_message = result.get("message", "Unknown error")
-            print(f"[Scheduler] Failed to post: {scheduled.error_message}")
+            logger.warning(f"Failed to post: {scheduled.error_message}")
         
         await db.commit()
         
     except Exception as e:
-        print(f"[Scheduler] Error processing scheduled post: {e}")
+        logger.exception(f"Error processing scheduled post: {e}")
         scheduled.status = "failed"
         scheduled.error_message = str(e)
         await db.commit()
@@ -317,7 +342,7 @@ async def generate_post_for_schedule(db: AsyncSession, scheduled: ScheduledPost,
 
 async def generate_news_post_for_schedule(db: AsyncSession, scheduled: ScheduledPost, auto_settings: AutoPostSettings) -> Post:
     """Generate a news post for a scheduled item."""
-    print(f"[Scheduler] Generating news post for scheduled {scheduled.id}")
+    logger.info(f"Generating news post for scheduled {scheduled.id}")
     
     # Get news settings
     accent_color = getattr(scheduled, 'news_accent_color', None) or getattr(auto_settings, 'news_accent_color', 'cyan') or 'cyan'
@@ -334,7 +359,7 @@ async def generate_news_post_for_schedule(db: AsyncSession, scheduled: Scheduled
     # Fetch news
     news = await search_news_serpapi(time_range=time_range)
     if not news:
-        print("[Scheduler] No news found")
+        logger.warning("No news found")
         return None
     
     # Select news item
@@ -343,13 +368,10 @@ async def generate_news_post_for_schedule(db: AsyncSession, scheduled: Scheduled
     else:
         news_item = news[0]
     
-    # Generate headline
-    headline = await generate_hook_headline(news_item["title"], news_item.get("snippet", ""))
+    # Caption only needs the news item - generate it while the headline and image are made
+    caption_task = asyncio.create_task(generate_ai_news_caption(news_item))
     category = news_item.get("category", "SUPPLY CHAIN")
     
-    # Generate caption
-    caption = await generate_ai_news_caption(news_item)
-    
     # Map accent color
     accent_colors = {
         "cyan": (0, 200, 255),
@@ -363,12 +385,21 @@ async def generate_news_post_for_schedule(db: AsyncSession, scheduled: Scheduled
     }
     accent_rgb = accent_colors.get(accent_color, (0, 200, 255))
     
-    # Render image
-    image_path = await render_news_post(
-        headline=headline,
-        category=category,
-        accent_color=accent_rgb,
-    )
+    try:
+        # Generate headline
+        headline = await generate_hook_headline(news_item["title"], news_item.get("snippet", ""))
+        
+        # Render image
+        image_path = await render_news_post(
+            headline=headline,
+            category=category,
+            accent_color=accent_rgb,
+        )
+    except BaseException:
+        caption_task.cancel()
+        raise
+    
+    caption = await caption_task
     
     import os
     image_filename = os.path.basename(image_path)
@@ -418,24 +449,17 @@ async def generate_carousel_post_for_schedule(db: AsyncSession, scheduled: Sched
     
     # Randomize if set to random
     if template_id == "random":
-        templates = get_all_templates()
-        template_id = random.choice([t["id"] for t in templates])
+        template_id = random.choice(_TEMPLATE_IDS)
     
     if color_theme == "random":
-        colors = list_color_themes()
-        color_theme = random.choice([c["id"] for c in colors])
+        color_theme = random.choice(_COLOR_THEME_IDS)
     
     if texture == "random":
-        textures = list_textures()
-        texture = random.choice([t["id"] for t in textures])
+        texture = random.choice(_TEXTURE_IDS)
     
     if layout == "random":
-        layouts = list_layouts()
         # 60% chance for centered
-        if random.random() < 0.6:
-            layout = "centered"
-        else:
-            layout = random.choice([l["id"] for l in layouts if l["id"] != "centered"])
+        layout = "centered" if random.random() < 0.6 else random.choice(_NON_CENTERED_LAYOUTS)
     
     # Simple topic discovery - just use a generic topic
     topic = f"AI-Powered Logistics Optimization #{random.randint(1000, 9999)}"
@@ -517,7 +541,7 @@ async def generate_carousel_post_for_schedule(db: AsyncSession, scheduled: Sched
 def start_scheduler():
     """Start the background scheduler."""
     if scheduler.running:
-        print("[Scheduler] Already running")
+        logger.info("Already running")
         return
     
     # Check every 5 minutes (not too frequent to avoid spam)
@@ -532,12 +556,12 @@ def start_scheduler():
     # DO NOT run immediately on startup - wait for first interval
     
     scheduler.start()
-    print("[Scheduler] Started - checking every 5 minutes")
+    logger.info("Started - checking every 5 minutes")
 
 
 async def trigger_manual_check():
     """Manually trigger a scheduler check (for debugging)."""
-    print("[Scheduler] Manual check triggered")
+    logger.info("Manual check triggered")
     await check_and_post_scheduled()
 
 
@@ -545,4 +569,4 @@ def stop_scheduler():
     """Stop the scheduler."""
     if scheduler.running:
         scheduler.shutdown()
-        print("[Scheduler] Stopped")
+        logger.info("Stopped")
@@ -3,15 +3,66 @@ Social Media Posting Service
 Handles posting videos to Instagram, TikTok, and YouTube with platform-specific optimizations.
 """
 import os
+import json
+import asyncio
 import logging
+import random
+import time
+import anyio
 import httpx
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+
+def _json_loads(res: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when available."""
+    return orjson.loads(res.content) if HAS_ORJSON else res.json()
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a JSON request body, using orjson when available."""
+    return orjson.dumps(obj) if HAS_ORJSON else json.dumps(obj).encode()
+
+# Shared HTTP client so every poster reuses pooled keep-alive connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HAS_HTTP2,  # Multiplex status polls and publishes over one connection
+            timeout=120.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared AsyncClient (called on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 @dataclass
 class PlatformContent:
@@ -22,6 +73,167 @@ class PlatformContent:
     tags: List[str]  # For YouTube tags
     
 
+# Common viral hashtags by category
+_CATEGORY_HASHTAGS = {
+    "funny": {
+        "instagram": ("#funny", "#comedy", "#viral", "#lol", "#memes", "#fyp", "#reels", "#humor", "#trending", "#funnyvideos"),
+        "tiktok": ("#funny", "#comedy", "#viral", "#fyp", "#foryou", "#foryoupage", "#humor", "#memes", "#lol", "#trending"),
+        "youtube": ("funny", "comedy", "viral video", "hilarious", "must watch", "trending"),
+    },
+    "educational": {
+        "instagram": ("#educational", "#learn", "#facts", "#didyouknow", "#knowledge", "#tips", "#howto", "#fyp", "#reels"),
+        "tiktok": ("#educational", "#learnontiktok", "#facts", "#didyouknow", "#fyp", "#foryou", "#knowledge", "#tips"),
+        "youtube": ("educational", "learn", "facts", "how to", "tutorial", "explained", "knowledge"),
+    },
+    "dramatic": {
+        "instagram": ("#dramatic", "#storytime", "#viral", "#mustwatch", "#shocking", "#reels", "#fyp", "#trending"),
+        "tiktok": ("#dramatic", "#storytime", "#viral", "#fyp", "#foryou", "#shocking", "#pov", "#trending"),
+        "youtube": ("dramatic", "story time", "must watch", "viral", "shocking", "incredible"),
+    },
+    "default": {
+        "instagram": ("#viral", "#trending", "#reels", "#fyp", "#explore", "#instagood", "#foryou", "#content", "#creator"),
+        "tiktok": ("#viral", "#fyp", "#foryou", "#foryoupage", "#trending", "#tiktok", "#content"),
+        "youtube": ("viral", "trending", "must watch", "amazing", "incredible", "2026"),
+    },
+}
+
+_VALID_CATEGORIES = frozenset(_CATEGORY_HASHTAGS)
+
+
+@dataclass(frozen=True)
+class _PlatformTags:
+    """Pre-sliced hashtags/tags for one (category, platform) pair."""
+    hashtags: tuple
+    tags: tuple
+    hashtag_str: str  # hashtags joined with spaces
+    tag_str: str  # first 15 tags joined with commas (YouTube description)
+
+
+# (hashtag count, tag count) used by each platform; "other" covers unknown platforms
+_TAG_LIMITS = {
+    "instagram": (20, 0),
+    "tiktok": (10, 0),
+    "youtube": (5, 30),
+    "other": (10, 0),
+}
+
+
+def _build_platform_tags() -> Dict[tuple, _PlatformTags]:
+    """Slice every category's hashtags once per platform."""
+    prebuilt = {}
+    for cat_key, by_platform in _CATEGORY_HASHTAGS.items():
+        for platform, (n_hashtags, n_tags) in _TAG_LIMITS.items():
+            # Drop repeated tags, keeping first-seen order
+            platform_tags = tuple(dict.fromkeys(by_platform.get(platform, _CATEGORY_HASHTAGS["default"]["instagram"])))
+            prebuilt[(cat_key, platform)] = _PlatformTags(
+                hashtags=platform_tags[:n_hashtags],
+                tags=platform_tags[:n_tags],
+                hashtag_str=" ".join(platform_tags[:n_hashtags]),
+                tag_str=", ".join(platform_tags[:15]),
+            )
+    return prebuilt
+
+
+_PLATFORM_TAGS = _build_platform_tags()
+
+
+@lru_cache(maxsize=64)
+def _get_platform_config(category: str, platform: str) -> tuple:
+    """Resolve raw category/platform names to (content builder, _PlatformTags)."""
+    category_l = category.lower()
+    platform_l = platform.lower()
+    cat_key = category_l if category_l in _VALID_CATEGORIES else "default"
+    prebuilt = _PLATFORM_TAGS.get((cat_key, platform_l)) or _PLATFORM_TAGS[(cat_key, "other")]
+    return _BUILDERS.get(platform_l, _build_default), prebuilt
+
+
+# YouTube description skeleton; only the intro, body and tag line vary per video
+_YT_DESCRIPTION_TEMPLATE = "\n".join([
+    "🔥 {intro}",
+    "",
+    "📌 WATCH TILL THE END!",
+    "",
+    "{body}",
+    "",
+    "─" * 30,
+    "",
+    "📊 More content like this coming soon!",
+    "👍 LIKE if you enjoyed",
+    "💬 COMMENT your thoughts",
+    "🔔 SUBSCRIBE for more!",
+    "",
+    "─" * 30,
+    "",
+    "🏷️ Tags:",
+    "{tag_str}",
+    "",
+    "#Shorts #Viral #Trending #YouTube #MustWatch",
+])
+
+
+def _build_instagram(base_caption: str, hook: str, prebuilt: _PlatformTags) -> PlatformContent:
+    """Instagram: Short caption + hook + hashtags (max 30 hashtags, ~2200 chars)."""
+    title = (hook or base_caption)[:100]
+    description = f"{hook}\n\n{base_caption[:500]}\n\n" + prebuilt.hashtag_str
+    return PlatformContent(
+        title=title,
+        description=description,
+        hashtags=list(prebuilt.hashtags),
+        tags=[],
+    )
+
+
+def _build_tiktok(base_caption: str, hook: str, prebuilt: _PlatformTags) -> PlatformContent:
+    """TikTok: Very short, punchy, hashtag-heavy (max ~150 chars visible)."""
+    lead = (hook or base_caption)[:100]
+    title = lead[:80]
+    # TikTok description is limited, focus on hashtags
+    description = f"{lead} " + prebuilt.hashtag_str
+    return PlatformContent(
+        title=title,
+        description=description[:150],
+        hashtags=list(prebuilt.hashtags),
+        tags=[],
+    )
+
+
+def _build_youtube(base_caption: str, hook: str, prebuilt: _PlatformTags) -> PlatformContent:
+    """YouTube: SEO-optimized, long description with keywords and tags."""
+    # At most 84 chars, so the title[:100] cap below returns the same object
+    title = (hook or base_caption)[:70] + (" | Must Watch!" if hook else " | Viral Video")
+    
+    # Build SEO-rich description
+    description = _YT_DESCRIPTION_TEMPLATE.format(
+        intro=hook if hook else base_caption[:200],
+        body=base_caption[:1000] if base_caption else "",
+        tag_str=prebuilt.tag_str,
+    )
+    
+    return PlatformContent(
+        title=title[:100],  # YouTube title max 100 chars
+        description=description[:5000],  # YouTube description max 5000 chars
+        hashtags=list(prebuilt.hashtags),  # YouTube hashtags (in title/description)
+        tags=list(prebuilt.tags),  # YouTube video tags (separate field)
+    )
+
+
+def _build_default(base_caption: str, hook: str, prebuilt: _PlatformTags) -> PlatformContent:
+    """Any other platform: plain caption and a few hashtags."""
+    return PlatformContent(
+        title=hook or base_caption[:100],
+        description=base_caption[:500],
+        hashtags=list(prebuilt.hashtags),
+        tags=[],
+    )
+
+
+_BUILDERS = {
+    "instagram": _build_instagram,
+    "tiktok": _build_tiktok,
+    "youtube": _build_youtube,
+}
+
+
 def generate_platform_content(
     base_caption: str,
     hook: str,
@@ -35,105 +247,15 @@ def generate_platform_content(
     - TikTok: Trendy, challenge-friendly, viral hashtags
     - YouTube: SEO-optimized, keyword-rich descriptions and tags
     """
-    # Common viral hashtags by category
-    category_hashtags = {
-        "funny": {
-            "instagram": ["#funny", "#comedy", "#viral", "#lol", "#memes", "#fyp", "#reels", "#humor", "#trending", "#funnyvideos"],
-            "tiktok": ["#funny", "#comedy", "#viral", "#fyp", "#foryou", "#foryoupage", "#humor", "#memes", "#lol", "#trending"],
-            "youtube": ["funny", "comedy", "viral video", "hilarious", "must watch", "trending"],
-        },
-        "educational": {
-            "instagram": ["#educational", "#learn", "#facts", "#didyouknow", "#knowledge", "#tips", "#howto", "#fyp", "#reels"],
-            "tiktok": ["#educational", "#learnontiktok", "#facts", "#didyouknow", "#fyp", "#foryou", "#knowledge", "#tips"],
-            "youtube": ["educational", "learn", "facts", "how to", "tutorial", "explained", "knowledge"],
-        },
-        "dramatic": {
-            "instagram": ["#dramatic", "#storytime", "#viral", "#mustwatch", "#shocking", "#reels", "#fyp", "#trending"],
-            "tiktok": ["#dramatic", "#storytime", "#viral", "#fyp", "#foryou", "#shocking", "#pov", "#trending"],
-            "youtube": ["dramatic", "story time", "must watch", "viral", "shocking", "incredible"],
-        },
-        "default": {
-            "instagram": ["#viral", "#trending", "#reels", "#fyp", "#explore", "#instagood", "#foryou", "#content", "#creator"],
-            "tiktok": ["#viral", "#fyp", "#foryou", "#foryoupage", "#trending", "#tiktok", "#viral", "#content"],
-            "youtube": ["viral", "trending", "must watch", "amazing", "incredible", "2026"],
-        },
-    }
-    
-    # Get category-specific hashtags
-    cat_key = category.lower() if category.lower() in category_hashtags else "default"
-    platform_tags = category_hashtags[cat_key].get(platform.lower(), category_hashtags["default"]["instagram"])
-    
-    if platform.lower() == "instagram":
-        # Instagram: Short caption + hook + hashtags (max 30 hashtags, ~2200 chars)
-        title = hook[:100] if hook else base_caption[:100]
-        description = f"{hook}\n\n{base_caption[:500]}\n\n" + " ".join(platform_tags[:20])
-        return PlatformContent(
-            title=title,
-            description=description,
-            hashtags=platform_tags[:20],
-            tags=[],
-        )
-    
-    elif platform.lower() == "tiktok":
-        # TikTok: Very short, punchy, hashtag-heavy (max ~150 chars visible)
-        title = hook[:80] if hook else base_caption[:80]
-        # TikTok description is limited, focus on hashtags
-        hashtags = platform_tags[:10]
-        description = f"{hook[:100] if hook else base_caption[:100]} " + " ".join(hashtags)
-        return PlatformContent(
-            title=title,
-            description=description[:150],
-            hashtags=hashtags,
-            tags=[],
-        )
-    
-    elif platform.lower() == "youtube":
-        # YouTube: SEO-optimized, long description with timestamps and keywords
-        title = f"{hook[:70]} | Must Watch!" if hook else f"{base_caption[:70]} | Viral Video"
-        
-        # Build SEO-rich description
-        description_parts = [
-            f"🔥 {hook if hook else base_caption[:200]}",
-            "",
-            "📌 WATCH TILL THE END!",
-            "",
-            base_caption[:1000] if base_caption else "",
-            "",
-            "─" * 30,
-            "",
-            "📊 More content like this coming soon!",
-            "👍 LIKE if you enjoyed",
-            "💬 COMMENT your thoughts",
-            "🔔 SUBSCRIBE for more!",
-            "",
-            "─" * 30,
-            "",
-            "🏷️ Tags:",
-            ", ".join(platform_tags[:15]),
-            "",
-            "#Shorts #Viral #Trending #YouTube #MustWatch",
-        ]
-        description = "\n".join(description_parts)
-        
-        return PlatformContent(
-            title=title[:100],  # YouTube title max 100 chars
-            description=description[:5000],  # YouTube description max 5000 chars
-            hashtags=platform_tags[:5],  # YouTube hashtags (in title/description)
-            tags=platform_tags[:30],  # YouTube video tags (separate field)
-        )
-    
-    # Default
-    return PlatformContent(
-        title=hook or base_caption[:100],
-        description=base_caption[:500],
-        hashtags=platform_tags[:10],
-        tags=[],
-    )
+    builder, prebuilt = _get_platform_config(category, platform)
+    return builder(base_caption, hook, prebuilt)
 
 
 class InstagramPoster:
     """Post videos to Instagram Reels via Graph API."""
     
+    PROCESSING_TIMEOUT = 300  # seconds to wait for the media container to finish
+    
     def __init__(self, access_token: str, instagram_account_id: str = None):
         self.access_token = access_token
         self.account_id = instagram_account_id
@@ -144,36 +266,36 @@ class InstagramPoster:
         if self.account_id:
             return self.account_id
         
-        async with httpx.AsyncClient() as client:
-            # Get pages
-            res = await client.get(
-                f"{self.api_base}/me/accounts",
-                params={"access_token": self.access_token}
-            )
-            data = res.json()
-            
-            if "data" not in data or not data["data"]:
-                raise ValueError("No Facebook pages found")
-            
-            page = data["data"][0]
-            page_id = page["id"]
-            page_token = page["access_token"]
-            
-            # Get Instagram account linked to page
-            res = await client.get(
-                f"{self.api_base}/{page_id}",
-                params={
-                    "fields": "instagram_business_account",
-                    "access_token": page_token,
-                }
-            )
-            data = res.json()
-            
-            if "instagram_business_account" not in data:
-                raise ValueError("No Instagram business account linked to page")
-            
-            self.account_id = data["instagram_business_account"]["id"]
-            return self.account_id
+        client = get_http_client()
+        # Get pages
+        res = await client.get(
+            f"{self.api_base}/me/accounts",
+            params={"access_token": self.access_token}
+        )
+        data = _json_loads(res)
+        
+        if "data" not in data or not data["data"]:
+            raise ValueError("No Facebook pages found")
+        
+        page = data["data"][0]
+        page_id = page["id"]
+        page_token = page["access_token"]
+        
+        # Get Instagram account linked to page
+        res = await client.get(
+            f"{self.api_base}/{page_id}",
+            params={
+                "fields": "instagram_business_account",
+                "access_token": page_token,
+            }
+        )
+        data = _json_loads(res)
+        
+        if "instagram_business_account" not in data:
+            raise ValueError("No Instagram business account linked to page")
+        
+        self.account_id = data["instagram_business_account"]["id"]
+        return self.account_id
     
     async def post_video(
         self,
@@ -191,66 +313,73 @@ class InstagramPoster:
         """
         account_id = await self.get_account_id()
         
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            # Step 1: Create media container
-            res = await client.post(
-                f"{self.api_base}/{account_id}/media",
-                data={
-                    "media_type": "REELS",
-                    "video_url": video_url,
-                    "caption": caption,
-                    "share_to_feed": str(share_to_feed).lower(),
-                    "access_token": self.access_token,
-                }
-            )
-            container_data = res.json()
-            
-            if "id" not in container_data:
-                logger.error(f"Instagram container creation failed: {container_data}")
-                raise ValueError(f"Failed to create media container: {container_data.get('error', {}).get('message', 'Unknown error')}")
-            
-            container_id = container_data["id"]
-            logger.info(f"Created Instagram media container: {container_id}")
-            
-            # Step 2: Wait for processing and publish
-            import asyncio
-            for _ in range(30):  # Wait up to 5 minutes
-                await asyncio.sleep(10)
-                
-                status_res = await client.get(
-                    f"{self.api_base}/{container_id}",
-                    params={
-                        "fields": "status_code",
-                        "access_token": self.access_token,
-                    }
-                )
-                status_data = status_res.json()
-                status = status_data.get("status_code")
-                
-                if status == "FINISHED":
-                    break
-                elif status == "ERROR":
-                    raise ValueError("Instagram video processing failed")
+        client = get_http_client()
+        # Step 1: Create media container
+        res = await client.post(
+            f"{self.api_base}/{account_id}/media",
+            data={
+                "media_type": "REELS",
+                "video_url": video_url,
+                "caption": caption,
+                "share_to_feed": str(share_to_feed).lower(),
+                "access_token": self.access_token,
+            }
+        )
+        container_data = _json_loads(res)
+        
+        if "id" not in container_data:
+            logger.error(f"Instagram container creation failed: {container_data}")
+            raise ValueError(f"Failed to create media container: {container_data.get('error', {}).get('message', 'Unknown error')}")
+        
+        container_id = container_data["id"]
+        logger.info(f"Created Instagram media container: {container_id}")
+        
+        # Step 2: Wait for processing and publish
+        # The Graph API has no status webhook for media containers, so poll until a deadline
+        deadline = time.monotonic() + self.PROCESSING_TIMEOUT
+        attempt = 0
+        while True:
+            # Back off from 1s up to 15s - most reels finish within seconds
+            delay = min(15.0, 1.5 ** attempt) * random.uniform(0.8, 1.2)
+            await asyncio.sleep(delay)
+            attempt += 1
             
-            # Step 3: Publish
-            publish_res = await client.post(
-                f"{self.api_base}/{account_id}/media_publish",
-                data={
-                    "creation_id": container_id,
+            status_res = await client.get(
+                f"{self.api_base}/{container_id}",
+                params={
+                    "fields": "status_code",
                     "access_token": self.access_token,
                 }
             )
-            publish_data = publish_res.json()
-            
-            if "id" not in publish_data:
-                raise ValueError(f"Failed to publish: {publish_data}")
+            status_data = _json_loads(status_res)
+            status = status_data.get("status_code")
             
-            return {
-                "platform": "instagram",
-                "success": True,
-                "post_id": publish_data["id"],
-                "url": f"https://www.instagram.com/reel/{publish_data['id']}/",
+            if status == "FINISHED":
+                break
+            elif status == "ERROR":
+                raise ValueError("Instagram video processing failed")
+            elif time.monotonic() >= deadline:
+                raise ValueError(f"Instagram video processing timed out (last status: {status})")
+        
+        # Step 3: Publish
+        publish_res = await client.post(
+            f"{self.api_base}/{account_id}/media_publish",
+            data={
+                "creation_id": container_id,
+                "access_token": self.access_token,
             }
+        )
+        publish_data = _json_loads(publish_res)
+        
+        if "id" not in publish_data:
+            raise ValueError(f"Failed to publish: {publish_data}")
+        
+        return {
+            "platform": "instagram",
+            "success": True,
+            "post_id": publish_data["id"],
+            "url": f"https://www.instagram.com/reel/{publish_data['id']}/",
+        }
 
 
 class TikTokPoster:
@@ -260,25 +389,30 @@ class TikTokPoster:
         self.client_key = client_key
         self.client_secret = client_secret
         self.access_token = access_token
+        self._token_expires_at = 0.0  # Unknown until the first refresh
         self.api_base = "https://open.tiktokapis.com/v2"
     
     async def refresh_access_token(self, refresh_token: str) -> str:
-        """Refresh the access token."""
-        async with httpx.AsyncClient() as client:
-            res = await client.post(
-                f"{self.api_base}/oauth/token/",
-                data={
-                    "client_key": self.client_key,
-                    "client_secret": self.client_secret,
-                    "grant_type": "refresh_token",
-                    "refresh_token": refresh_token,
-                }
-            )
-            data = res.json()
-            if "access_token" in data:
-                self.access_token = data["access_token"]
-                return data["access_token"]
-            raise ValueError(f"Failed to refresh token: {data}")
+        """Refresh the access token (skipped while a refreshed token is still valid)."""
+        if self.access_token and time.monotonic() < self._token_expires_at - 60:
+            return self.access_token
+        
+        client = get_http_client()
+        res = await client.post(
+            f"{self.api_base}/oauth/token/",
+            data={
+                "client_key": self.client_key,
+                "client_secret": self.client_secret,
+                "grant_type": "refresh_token",
+                "refresh_token": refresh_token,
+            }
+        )
+        data = _json_loads(res)
+        if "access_token" in data:
+            self.access_token = data["access_token"]
+            self._token_expires_at = time.monotonic() + int(data.get("expires_in", 86400))
+            return data["access_token"]
+        raise ValueError(f"Failed to refresh token: {data}")
     
     async def post_video_by_url(
         self,
@@ -300,49 +434,52 @@ class TikTokPoster:
         if not self.access_token:
             raise ValueError("Access token required for TikTok posting")
         
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            # Initialize video upload
-            init_res = await client.post(
-                f"{self.api_base}/post/publish/video/init/",
-                headers={
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Content-Type": "application/json",
+        client = get_http_client()
+        # Initialize video upload
+        init_res = await client.post(
+            f"{self.api_base}/post/publish/video/init/",
+            headers={
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+            },
+            content=_json_dumps({
+                "post_info": {
+                    "title": title[:150],
+                    "privacy_level": privacy_level,
+                    "disable_comment": disable_comment,
+                    "disable_duet": disable_duet,
+                    "disable_stitch": disable_stitch,
                 },
-                json={
-                    "post_info": {
-                        "title": title[:150],
-                        "privacy_level": privacy_level,
-                        "disable_comment": disable_comment,
-                        "disable_duet": disable_duet,
-                        "disable_stitch": disable_stitch,
-                    },
-                    "source_info": {
-                        "source": "PULL_FROM_URL",
-                        "video_url": video_url,
-                    }
+                "source_info": {
+                    "source": "PULL_FROM_URL",
+                    "video_url": video_url,
                 }
-            )
-            
-            init_data = init_res.json()
-            
-            if init_data.get("error", {}).get("code") != "ok":
-                logger.error(f"TikTok init failed: {init_data}")
-                raise ValueError(f"TikTok upload failed: {init_data.get('error', {}).get('message', 'Unknown error')}")
-            
-            publish_id = init_data.get("data", {}).get("publish_id")
-            
-            return {
-                "platform": "tiktok",
-                "success": True,
-                "publish_id": publish_id,
-                "status": "processing",
-                "message": "Video submitted to TikTok. It will appear on your profile once processed.",
-            }
+            }),
+        )
+        
+        init_data = _json_loads(init_res)
+        
+        if init_data.get("error", {}).get("code") != "ok":
+            logger.error(f"TikTok init failed: {init_data}")
+            raise ValueError(f"TikTok upload failed: {init_data.get('error', {}).get('message', 'Unknown error')}")
+        
+        publish_id = init_data.get("data", {}).get("publish_id")
+        
+        return {
+            "platform": "tiktok",
+            "success": True,
+            "publish_id": publish_id,
+            "status": "processing",
+            "message": "Video submitted to TikTok. It will appear on your profile once processed.",
+        }
 
 
 class YouTubePoster:
     """Post videos to YouTube via Data API v3."""
     
+    UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # Must be a multiple of 256 KiB
+    UPLOAD_MAX_RETRIES = 5
+    
     def __init__(
         self,
         api_key: str,
@@ -355,34 +492,37 @@ class YouTubePoster:
         self.client_secret = client_secret
         self.refresh_token = refresh_token
         self.access_token = None
+        self._token_expires_at = 0.0
         self.api_base = "https://www.googleapis.com/youtube/v3"
         self.upload_base = "https://www.googleapis.com/upload/youtube/v3"
     
     async def get_access_token(self) -> str:
         """Get access token using refresh token."""
-        if self.access_token:
+        # Reuse the cached token until a minute before it expires
+        if self.access_token and time.monotonic() < self._token_expires_at - 60:
             return self.access_token
         
         if not self.refresh_token or not self.client_id or not self.client_secret:
             raise ValueError("OAuth credentials required for YouTube upload")
         
-        async with httpx.AsyncClient() as client:
-            res = await client.post(
-                "https://oauth2.googleapis.com/token",
-                data={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "refresh_token": self.refresh_token,
-                    "grant_type": "refresh_token",
-                }
-            )
-            data = res.json()
-            
-            if "access_token" in data:
-                self.access_token = data["access_token"]
-                return self.access_token
-            
-            raise ValueError(f"Failed to get YouTube access token: {data}")
+        client = get_http_client()
+        res = await client.post(
+            "https://oauth2.googleapis.com/token",
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": self.refresh_token,
+                "grant_type": "refresh_token",
+            }
+        )
+        data = _json_loads(res)
+        
+        if "access_token" in data:
+            self.access_token = data["access_token"]
+            self._token_expires_at = time.monotonic() + int(data.get("expires_in", 3600))
+            return self.access_token
+        
+        raise ValueError(f"Failed to get YouTube access token: {data}")
     
     async def upload_video(
         self,
@@ -407,8 +547,8 @@ class YouTubePoster:
         """
         access_token = await self.get_access_token()
         
-        # Read video file
-        video_data = video_path.read_bytes()
+        # Stream the file from disk rather than holding it all in memory
+        file_size = video_path.stat().st_size
         
         # Prepare metadata
         metadata = {
@@ -424,52 +564,115 @@ class YouTubePoster:
             }
         }
         
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            # Resumable upload - Step 1: Initialize
-            init_res = await client.post(
-                f"{self.upload_base}/videos",
-                params={
-                    "uploadType": "resumable",
-                    "part": "snippet,status",
-                },
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Content-Type": "application/json",
-                    "X-Upload-Content-Type": "video/mp4",
-                    "X-Upload-Content-Length": str(len(video_data)),
-                },
-                json=metadata,
-            )
-            
-            if init_res.status_code != 200:
-                raise ValueError(f"YouTube upload init failed: {init_res.text}")
-            
-            upload_url = init_res.headers.get("Location")
-            if not upload_url:
-                raise ValueError("No upload URL returned from YouTube")
-            
-            # Step 2: Upload video data
-            upload_res = await client.put(
-                upload_url,
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Content-Type": "video/mp4",
-                },
-                content=video_data,
-            )
-            
-            if upload_res.status_code not in [200, 201]:
-                raise ValueError(f"YouTube video upload failed: {upload_res.text}")
-            
-            result = upload_res.json()
-            video_id = result.get("id")
-            
-            return {
-                "platform": "youtube",
-                "success": True,
-                "video_id": video_id,
-                "url": f"https://www.youtube.com/shorts/{video_id}" if result.get("snippet", {}).get("liveBroadcastContent") != "none" else f"https://www.youtube.com/watch?v={video_id}",
-            }
+        client = get_http_client()
+        # Resumable upload - Step 1: Initialize
+        init_res = await client.post(
+            f"{self.upload_base}/videos",
+            params={
+                "uploadType": "resumable",
+                "part": "snippet,status",
+            },
+            headers={
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json",
+                "X-Upload-Content-Type": "video/mp4",
+                "X-Upload-Content-Length": str(file_size),
+            },
+            content=_json_dumps(metadata),
+            timeout=300.0,
+        )
+        
+        if init_res.status_code != 200:
+            raise ValueError(f"YouTube upload init failed: {init_res.text}")
+        
+        upload_url = init_res.headers.get("Location")
+        if not upload_url:
+            raise ValueError("No upload URL returned from YouTube")
+        
+        # Step 2: Upload video data in chunks, resuming from the server's offset on failure
+        upload_res = await self._upload_chunks(client, upload_url, access_token, video_path, file_size)
+        
+        result = _json_loads(upload_res)
+        video_id = result.get("id")
+        
+        return {
+            "platform": "youtube",
+            "success": True,
+            "video_id": video_id,
+            "url": f"https://www.youtube.com/shorts/{video_id}" if result.get("snippet", {}).get("liveBroadcastContent") != "none" else f"https://www.youtube.com/watch?v={video_id}",
+        }
+    
+    async def _upload_chunks(
+        self,
+        client: httpx.AsyncClient,
+        upload_url: str,
+        access_token: str,
+        video_path: Path,
+        file_size: int,
+    ) -> httpx.Response:
+        """
+        Send the video to a resumable upload session in UPLOAD_CHUNK_SIZE pieces.
+        
+        YouTube answers 308 with the committed byte range after each chunk. On a
+        network error or 5xx, back off, ask the server for its committed offset
+        and resend from there instead of restarting the whole file.
+        """
+        offset = 0
+        retries = 0  # Failed attempts since the committed offset last moved
+        query = False  # Whether the next request is a status query instead of a chunk
+        
+        # Read on a worker thread so concurrent posts keep running while chunks load
+        async with await anyio.open_file(video_path, "rb") as f:
+            while True:
+                if query:
+                    # Status query: empty body, unknown range
+                    content_range = f"bytes */{file_size}"
+                    chunk = b""
+                else:
+                    await f.seek(offset)
+                    chunk = await f.read(self.UPLOAD_CHUNK_SIZE)
+                    content_range = f"bytes {offset}-{offset + len(chunk) - 1}/{file_size}"
+                
+                try:
+                    res = await client.put(
+                        upload_url,
+                        headers={
+                            "Authorization": f"Bearer {access_token}",
+                            "Content-Type": "video/mp4",
+                            "Content-Range": content_range,
+                        },
+                        content=chunk,
+                        timeout=300.0,
+                    )
+                except httpx.TransportError as e:
+                    logger.warning(f"YouTube chunk upload error at byte {offset}: {e}")
+                    res = None
+                
+                if res is None or res.status_code >= 500:
+                    # Ask for the committed offset before resending
+                    query = True
+                elif res.status_code in (200, 201):
+                    return res
+                elif res.status_code == 308:
+                    # "Range: bytes=0-N" means bytes up to N are committed
+                    committed = res.headers.get("Range")
+                    new_offset = int(committed.rsplit("-", 1)[1]) + 1 if committed else 0
+                    progressed = new_offset > offset
+                    offset = new_offset
+                    if progressed:
+                        retries = 0
+                    if progressed or query:
+                        # Send the next chunk, or resend the failed one from the committed offset
+                        query = False
+                        continue
+                    # A chunk was answered but nothing new was committed - retry it
+                else:
+                    raise ValueError(f"YouTube video upload failed: {res.text}")
+                
+                retries += 1
+                if retries > self.UPLOAD_MAX_RETRIES:
+                    raise ValueError(f"YouTube video upload failed after {self.UPLOAD_MAX_RETRIES} retries at byte {offset}")
+                await asyncio.sleep(min(2 ** retries, 30))
 
 
 class SocialMediaManager:
@@ -589,29 +792,70 @@ class SocialMediaManager:
             "fail_count": 0,
         }
         
-        # Post to each platform
+        # Post to each configured platform concurrently
+        tasks = {}
         if self.instagram:
-            results["instagram"] = await self.post_to_instagram(video_url, caption, hook, category)
-            if results["instagram"].get("success"):
-                results["success_count"] += 1
-            else:
-                results["fail_count"] += 1
-        
+            tasks["instagram"] = self.post_to_instagram(video_url, caption, hook, category)
         if self.tiktok:
-            results["tiktok"] = await self.post_to_tiktok(video_url, caption, hook, category)
-            if results["tiktok"].get("success"):
-                results["success_count"] += 1
-            else:
-                results["fail_count"] += 1
-        
+            tasks["tiktok"] = self.post_to_tiktok(video_url, caption, hook, category)
         if self.youtube:
-            results["youtube"] = await self.post_to_youtube(video_path, caption, hook, category)
-            if results["youtube"].get("success"):
+            tasks["youtube"] = self.post_to_youtube(video_path, caption, hook, category)
+        
+        outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        
+        for platform, outcome in zip(tasks, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"{platform} post failed: {outcome}")
+                outcome = {"platform": platform, "success": False, "error": str(outcome)}
+            results[platform] = outcome
+            if outcome.get("success"):
                 results["success_count"] += 1
             else:
                 results["fail_count"] += 1
         
         return results
+    
+    async def post_many(
+        self,
+        videos: List[Dict[str, Any]],
+        concurrency: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """
+        Post several videos to all configured platforms, at most `concurrency` at a time.
+        
+        Args:
+            videos: post_to_all keyword arguments for each video
+            concurrency: Maximum number of videos being posted at once
+        
+        Returns one post_to_all result per video, in input order.
+        """
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def _bounded(video: Dict[str, Any]) -> Dict[str, Any]:
+            async with sem:
+                return await self.post_to_all(**video)
+        
+        outcomes = await asyncio.gather(*(_bounded(v) for v in videos), return_exceptions=True)
+        
+        results = []
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error(f"Batch post failed: {outcome}")
+                outcome = {"success_count": 0, "fail_count": 1, "error": str(outcome)}
+            results.append(outcome)
+        return results
+
+
+# Shared manager so posters (and their cached tokens/account ids) outlive a request
+_manager: Optional[SocialMediaManager] = None
+
+
+def get_social_manager(settings) -> SocialMediaManager:
+    """Get the shared SocialMediaManager, rebuilding it if the settings object changes."""
+    global _manager
+    if _manager is None or _manager.settings is not settings:
+        _manager = SocialMediaManager(settings)
+    return _manager
 
 
 # TikTok OAuth flow helpers
@@ -635,16 +879,16 @@ async def exchange_tiktok_code(
     redirect_uri: str,
 ) -> Dict[str, Any]:
     """Exchange TikTok authorization code for access token."""
-    async with httpx.AsyncClient() as client:
-        res = await client.post(
-            "https://open.tiktokapis.com/v2/oauth/token/",
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            data={
-                "client_key": client_key,
-                "client_secret": client_secret,
-                "code": code,
-                "grant_type": "authorization_code",
-                "redirect_uri": redirect_uri,
-            }
-        )
-        return res.json()
+    client = get_http_client()
+    res = await client.post(
+        "https://open.tiktokapis.com/v2/oauth/token/",
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        data={
+            "client_key": client_key,
+            "client_secret": client_secret,
+            "code": code,
+            "grant_type": "authorization_code",
+            "redirect_uri": redirect_uri,
+        }
+    )
+    return _json_loads(res)
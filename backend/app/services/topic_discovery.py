@@ -2,15 +2,56 @@
 Topic discovery service using SerpAPI to find fresh logistics + AI topics.
 """
 
+import asyncio
+import collections
+import random
+import re
+import time
 import httpx
 from datetime import datetime, timedelta
-from sqlalchemy import select, func
+from functools import lru_cache
+from sqlalchemy import select, func, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import UsedTopic
 from app.config import get_settings
 
 settings = get_settings()
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+# Shared SerpAPI client so concurrent searches reuse pooled connections
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HAS_HTTP2,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared AsyncClient (called on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 # Logistics + AI topic search queries
 SEARCH_QUERIES = [
     "AI logistics automation 2024 2025",
@@ -30,6 +71,12 @@ SEARCH_QUERIES = [
     "automated carrier selection logistics",
 ]
 
+# Number of SEARCH_QUERIES issued concurrently per discovery
+SERPAPI_FANOUT = 3
+
+# Queries issued by the last couple of discoveries; skipped when sampling the next batch
+_RECENT_QUERIES: collections.deque[str] = collections.deque(maxlen=5)
+
 # Curated logistics problem topics (fallback + supplementary)
 CURATED_TOPICS = [
     "ETA prediction accuracy in freight logistics",
@@ -65,137 +112,198 @@ CURATED_TOPICS = [
 ]
 
 
+# Keywords that indicate logistics relevance
+LOGISTICS_KEYWORDS = (
+    "logistics", "supply chain", "freight", "shipping", "warehouse",
+    "delivery", "carrier", "inventory", "transportation", "distribution",
+    "fulfillment", "tracking", "routing", "fleet", "shipment"
+)
+
+# Keywords that indicate AI relevance
+AI_KEYWORDS = (
+    "AI", "artificial intelligence", "machine learning", "ML", "predictive",
+    "automation", "automated", "intelligent", "smart", "optimization"
+)
+
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Alternation of lowercased keywords; short acronyms ("ai", "ml") must be whole words."""
+    parts = []
+    for kw in keywords:
+        kw = re.escape(kw.lower())
+        parts.append(rf"\b{kw}\b" if len(kw) <= 2 else kw)
+    return re.compile("|".join(parts))
+
+
+# One alternation per category, matched against the lowercased text in a single C-level scan
+_LOGISTICS_RE = _keyword_pattern(LOGISTICS_KEYWORDS)
+_AI_RE = _keyword_pattern(AI_KEYWORDS)
+
+# Title prefixes/separators stripped from SerpAPI titles, in one pass
+_CLEANUP_RE = re.compile(r"How |What |Why | - | \| |\.\.\.")
+
+
+# Used-topic sets per dedup window as (fetched_at, topics); kept fresh by record_used_topics
+USED_TOPICS_CACHE_TTL = 300  # seconds
+_used_topics_cache: dict[int, tuple[float, set[str]]] = {}
+
+
 async def get_used_topics(db: AsyncSession, window: int = None) -> set[str]:
-    """Get topics used in the last N posts."""
+    """Get topics used in the last N days (cached in-process for USED_TOPICS_CACHE_TTL)."""
     if window is None:
         window = settings.deduplication_window
     
+    cached = _used_topics_cache.get(window)
+    if cached and time.monotonic() - cached[0] < USED_TOPICS_CACHE_TTL:
+        return cached[1]
+    
     cutoff = datetime.utcnow() - timedelta(days=window)
     
     result = await db.execute(
-        select(UsedTopic.topic)
+        select(func.lower(UsedTopic.topic))
         .where(UsedTopic.created_at >= cutoff)
     )
     
-    return {row[0].lower() for row in result.fetchall()}
+    used_topics = set(result.scalars().all())
+    _used_topics_cache[window] = (time.monotonic(), used_topics)
+    return used_topics
+
+
+def _iter_serpapi_topics(data: dict, query: str):
+    """Yield relevant topics from the organic results of a SerpAPI response."""
+    for result in data.get("organic_results", []):
+        title = result.get("title", "")
+        snippet = result.get("snippet", "")
+        
+        # Extract topic from title/snippet
+        topic = extract_topic_from_text(title, snippet)
+        if topic:
+            yield {
+                "topic": topic,
+                "source": "serpapi",
+                "context": snippet[:200] if snippet else "",
+                "search_query": query
+            }
+
+
+SERPAPI_CACHE_TTL = 6 * 60 * 60  # seconds - results for a query change slowly
+_serpapi_cache: dict[str, tuple[float, list[dict]]] = {}
 
 
 async def search_topics_serpapi(query: str) -> list[dict]:
-    """Search for topics using SerpAPI."""
+    """Search for topics using SerpAPI (successful results cached per query for SERPAPI_CACHE_TTL)."""
+    cached = _serpapi_cache.get(query)
+    if cached and time.monotonic() - cached[0] < SERPAPI_CACHE_TTL:
+        return cached[1]
+    
     serpapi_key = settings.serpapi_key
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.get(
-                "https://serpapi.com/search",
-                params={
-                    "q": query,
-                    "api_key": serpapi_key,
-                    "engine": "google",
-                    "num": 10,
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            topics = []
-            
-            # Extract from organic results
-            for result in data.get("organic_results", []):
-                title = result.get("title", "")
-                snippet = result.get("snippet", "")
-                
-                # Extract topic from title/snippet
-                topic = extract_topic_from_text(title, snippet)
-                if topic:
-                    topics.append({
-                        "topic": topic,
-                        "source": "serpapi",
-                        "context": snippet[:200] if snippet else ""
-                    })
-            
-            return topics
-            
-        except Exception as e:
-            print(f"SerpAPI error: {e}")
-            return []
+    try:
+        response = await get_http_client().get(
+            "https://serpapi.com/search",
+            params={
+                "q": query,
+                "api_key": serpapi_key,
+                "engine": "google",
+                "num": 10,
+            }
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content) if HAS_ORJSON else response.json()
+        
+        topics = list(_iter_serpapi_topics(data, query))
+        _serpapi_cache[query] = (time.monotonic(), topics)
+        return topics
+        
+    except Exception as e:
+        print(f"SerpAPI error: {e}")
+        return []
 
 
 def extract_topic_from_text(title: str, snippet: str) -> str | None:
     """Extract a clean logistics topic from search result text."""
-    # Keywords that indicate logistics relevance
-    logistics_keywords = [
-        "logistics", "supply chain", "freight", "shipping", "warehouse",
-        "delivery", "carrier", "inventory", "transportation", "distribution",
-        "fulfillment", "tracking", "routing", "fleet", "shipment"
-    ]
-    
-    ai_keywords = [
-        "AI", "artificial intelligence", "machine learning", "ML", "predictive",
-        "automation", "automated", "intelligent", "smart", "optimization"
-    ]
-    
     text = f"{title} {snippet}".lower()
     
-    # Check for logistics + AI relevance
-    has_logistics = any(kw in text for kw in logistics_keywords)
-    has_ai = any(kw in text.lower() for kw in ai_keywords)
+    # Check for logistics + AI relevance - most off-topic results fail the
+    # logistics scan, so bail out before running the AI scan
+    if _LOGISTICS_RE.search(text) is None:
+        return None
     
-    if has_logistics and has_ai:
+    if _AI_RE.search(text) is not None:
         # Clean up the title as the topic
-        topic = title.strip()
         # Remove common prefixes/suffixes
-        for remove in ["How ", "What ", "Why ", " - ", " | ", "..."]:
-            topic = topic.replace(remove, " ")
+        topic = _CLEANUP_RE.sub(" ", title.strip())
         topic = " ".join(topic.split())[:100]
         return topic if len(topic) > 10 else None
     
     return None
 
 
+@lru_cache(maxsize=2048)
 def normalize_topic(topic: str) -> str:
     """Normalize topic for comparison."""
     return " ".join(topic.lower().split())
 
 
+# (topic, normalized topic) pairs for the fixed curated list
+_CURATED_NORMALIZED = tuple((t, normalize_topic(t)) for t in CURATED_TOPICS)
+
+
 async def discover_fresh_topic(db: AsyncSession, allow_reuse: bool = False) -> dict:
     """
     Discover a fresh logistics + AI topic.
     Returns dict with 'topic' and optional 'enrichment' data.
     """
     used_topics = set() if allow_reuse else await get_used_topics(db)
+    fresh_curated = [topic for topic, normalized in _CURATED_NORMALIZED if normalized not in used_topics]
     
-    # Try SerpAPI first
-    import random
-    search_query = random.choice(SEARCH_QUERIES)
-    
-    serpapi_topics = await search_topics_serpapi(search_query)
-    
-    # Filter out used topics
-    for item in serpapi_topics:
-        normalized = normalize_topic(item["topic"])
-        if normalized not in used_topics:
-            return {
-                "topic": item["topic"],
-                "enrichment": {
-                    "source": "serpapi",
-                    "context": item.get("context", ""),
-                    "search_query": search_query
-                }
+    # Serve a share of calls straight from curated topics - no SerpAPI latency or quota
+    if fresh_curated and random.random() < settings.curated_first_prob:
+        return {
+            "topic": random.choice(fresh_curated),
+            "enrichment": {
+                "source": "curated",
+                "context": ""
             }
+        }
+    
+    # Try SerpAPI - a few queries at once, first fresh topic wins
+    candidates = [q for q in SEARCH_QUERIES if q not in _RECENT_QUERIES]
+    if len(candidates) < SERPAPI_FANOUT:
+        candidates = SEARCH_QUERIES
+    search_queries = random.sample(candidates, k=SERPAPI_FANOUT)
+    _RECENT_QUERIES.extend(search_queries)
+    tasks = [asyncio.create_task(search_topics_serpapi(query)) for query in search_queries]
+    
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            serpapi_topics = await next_done
+            
+            # Filter out used topics
+            for item in serpapi_topics:
+                normalized = normalize_topic(item["topic"])
+                if normalized not in used_topics:
+                    return {
+                        "topic": item["topic"],
+                        "enrichment": {
+                            "source": "serpapi",
+                            "context": item.get("context", ""),
+                            "search_query": item["search_query"]
+                        }
+                    }
+    finally:
+        for task in tasks:
+            task.cancel()
     
     # Fallback to curated topics
-    random.shuffle(CURATED_TOPICS)
-    for topic in CURATED_TOPICS:
-        normalized = normalize_topic(topic)
-        if normalized not in used_topics:
-            return {
-                "topic": topic,
-                "enrichment": {
-                    "source": "curated",
-                    "context": ""
-                }
+    if fresh_curated:
+        return {
+            "topic": random.choice(fresh_curated),
+            "enrichment": {
+                "source": "curated",
+                "context": ""
             }
+        }
     
     # All topics exhausted
     if allow_reuse:
@@ -216,9 +324,26 @@ async def discover_fresh_topic(db: AsyncSession, allow_reuse: bool = False) -> d
 
 async def record_used_topic(db: AsyncSession, topic: str, post_id: int):
     """Record a topic as used."""
-    used_topic = UsedTopic(
-        topic=topic,
-        post_id=post_id
+    await record_used_topics(db, [(topic, post_id)])
+
+
+async def record_used_topics(db: AsyncSession, topics: list[tuple[str, int]]) -> list[int]:
+    """Record several (topic, post_id) pairs as used in a single INSERT ... RETURNING."""
+    if not topics:
+        return []
+    
+    stmt = (
+        insert(UsedTopic)
+        .values([{"topic": topic, "post_id": post_id} for topic, post_id in topics])
+        .returning(UsedTopic.id)
     )
-    db.add(used_topic)
+    result = await db.execute(stmt)
+    ids = list(result.scalars())
     await db.commit()
+    
+    # Keep cached windows in step so the next discovery skips these topics
+    lowered = {topic.lower() for topic, _ in topics}
+    for _, used_topics in _used_topics_cache.values():
+        used_topics.update(lowered)
+    
+    return ids
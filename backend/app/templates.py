@@ -3,6 +3,8 @@ Post templates for Instagram carousel generation.
 Each template defines a different framing/style while following the 4-slide STRUCTURE rules.
 """
 
+from types import MappingProxyType
+
 TEMPLATES = {
     "problem_first": {
         "id": "problem_first",
@@ -295,6 +297,18 @@ TEMPLATES = {
 }
 
 
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only views."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+# Templates are shared across requests - make them read-only so no caller can mutate them
+TEMPLATES = _freeze(TEMPLATES)
+
+
 def get_template(template_id: str) -> dict:
     """Get a template by ID."""
     if template_id not in TEMPLATES:
@@ -302,15 +316,19 @@ def get_template(template_id: str) -> dict:
     return TEMPLATES[template_id]
 
 
-def get_all_templates() -> list[dict]:
+# Template listing is static - build it once instead of on every request
+_ALL_TEMPLATES = tuple(
+    _freeze({
+        "id": t["id"],
+        "name": t["name"],
+        "description": t["description"],
+        "icon": t.get("icon", "📄"),
+        "preview_style": t.get("preview_style", "")
+    })
+    for t in TEMPLATES.values()
+)
+
+
+def get_all_templates() -> tuple[dict, ...]:
     """Get all available templates."""
-    return [
-        {
-            "id": t["id"],
-            "name": t["name"],
-            "description": t["description"],
-            "icon": t.get("icon", "📄"),
-            "preview_style": t.get("preview_style", "")
-        }
-        for t in TEMPLATES.values()
-    ]
+    return _ALL_TEMPLATES
@@ -3,14 +3,23 @@ import asyncio
 from sqlalchemy import text
 from app.database import get_engine
 
+# Both updates in one statement (data-modifying CTEs) - one round trip
+EMERGENCY_DISABLE_SQL = text("""
+    WITH disabled AS (
+        UPDATE auto_post_settings SET enabled = FALSE RETURNING 1
+    ), cancelled AS (
+        UPDATE scheduled_posts SET status = 'cancelled' WHERE status = 'pending' RETURNING 1
+    )
+    SELECT (SELECT count(*) FROM disabled), (SELECT count(*) FROM cancelled)
+""")
+
 async def emergency_disable():
     engine = get_engine()
     if engine:
         async with engine.begin() as conn:
-            # Disable auto-posting
-            await conn.execute(text("UPDATE auto_post_settings SET enabled = FALSE"))
-            # Cancel all pending posts
-            await conn.execute(text("UPDATE scheduled_posts SET status = 'cancelled' WHERE status = 'pending'"))
-            print("DONE: Auto-posting disabled, pending posts cancelled")
+            # Disable auto-posting and cancel all pending posts
+            result = await conn.execute(EMERGENCY_DISABLE_SQL)
+            disabled, cancelled = result.one()
+            print(f"DONE: Auto-posting disabled ({disabled} settings rows), {cancelled} pending posts cancelled")
 
 asyncio.run(emergency_disable())
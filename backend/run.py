@@ -16,9 +16,22 @@ if __name__ == "__main__":
     print(f"API Docs: http://localhost:{settings.port}/docs")
     print("=" * 50)
     
-    uvicorn.run(
-        "app.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=True
-    )
+    if settings.env == "development":
+        uvicorn.run(
+            "app.main:app",
+            host=settings.host,
+            port=settings.port,
+            reload=True
+        )
+    else:
+        # uvloop + httptools ship with uvicorn[standard]
+        # Single process only: every worker would start its own APScheduler
+        # (duplicate posts) and keep its own in-memory caches
+        uvicorn.run(
+            "app.main:app",
+            host=settings.host,
+            port=settings.port,
+            workers=1,
+            loop="uvloop",
+            http="httptools"
+        )
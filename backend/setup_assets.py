@@ -5,51 +5,107 @@ Run this before starting the server.
 """
 
 import os
+import re
+import shutil
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 FONT_URL = "https://fonts.google.com/download?family=Montserrat"
 ASSETS_DIR = Path("assets")
 FONTS_DIR = ASSETS_DIR / "fonts" / "Montserrat"
+FONTS_SENTINEL = FONTS_DIR / ".installed"  # Written once every required font is extracted
+COPY_CHUNK_SIZE = 64 * 1024
+EXTRACT_WORKERS = 4
+EXTRACT_CHUNK_SIZE = 1024 * 1024  # Whole fonts are a few hundred KiB - inflate each in one or two reads
+
+# Static font files the renderer needs
+REQUIRED_FONTS = (
+    "Montserrat-Regular.ttf",
+    "Montserrat-Medium.ttf",
+    "Montserrat-SemiBold.ttf",
+    "Montserrat-Bold.ttf",
+    "Montserrat-ExtraBold.ttf",
+)
+WANTED_FONTS = frozenset(REQUIRED_FONTS)
+# Archive members to extract: the required fonts under a static/ folder
+WANTED_MEMBER_RE = re.compile(r"static/(?:" + "|".join(map(re.escape, REQUIRED_FONTS)) + r")$")
+
+
+def list_dir(path: Path) -> set:
+    """Names of entries in a directory (one directory read instead of a stat per file)."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
 
 
 def setup_directories():
     """Create required directories."""
     print("Creating directories...")
-    ASSETS_DIR.mkdir(exist_ok=True)
-    FONTS_DIR.mkdir(parents=True, exist_ok=True)
+    FONTS_DIR.mkdir(parents=True, exist_ok=True)  # Also creates ASSETS_DIR
     Path("generated_images").mkdir(exist_ok=True)
     print("✓ Directories created")
 
 
+def extract_font(zip_path: Path, member: str) -> str:
+    """Inflate one archive member into FONTS_DIR and return its file name."""
+    font_name = member.rpartition('/')[2]
+    # ZipFile handles are not safe to share across threads, so each worker opens its own
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        with zip_ref.open(member) as src, open(FONTS_DIR / font_name, 'wb', buffering=EXTRACT_CHUNK_SIZE) as dst:
+            shutil.copyfileobj(src, dst, EXTRACT_CHUNK_SIZE)
+    return font_name
+
+
+def is_valid_zip(zip_path: Path) -> bool:
+    """Whether zip_path holds a complete archive; a corrupt one is removed."""
+    if not zip_path.exists():
+        return False
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            if zip_ref.testzip() is None:
+                return True
+    except zipfile.BadZipFile:
+        pass
+    zip_path.unlink()
+    return False
+
+
 def download_fonts():
     """Download Montserrat fonts from Google Fonts."""
     zip_path = ASSETS_DIR / "montserrat.zip"
     
-    if any(FONTS_DIR.glob("*.ttf")):
+    if FONTS_SENTINEL.exists() or any(FONTS_DIR.glob("*.ttf")):
         print("✓ Fonts already exist, skipping download")
         return
     
-    print("Downloading Montserrat fonts...")
     try:
-        urllib.request.urlretrieve(FONT_URL, zip_path)
-        print("✓ Downloaded font archive")
+        if is_valid_zip(zip_path):
+            # A previous run downloaded the archive but did not finish extracting
+            print("✓ Reusing existing font archive")
+        else:
+            print("Downloading Montserrat fonts...")
+            # Stream the archive to disk in chunks instead of buffering it
+            with urllib.request.urlopen(FONT_URL, timeout=30) as response, open(zip_path, 'wb') as f:
+                shutil.copyfileobj(response, f, COPY_CHUNK_SIZE)
+            print("✓ Downloaded font archive")
         
         print("Extracting fonts...")
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            for file in zip_ref.namelist():
-                if file.endswith('.ttf') and 'static' in file:
-                    # Extract only the static TTF files we need
-                    font_name = os.path.basename(file)
-                    if any(weight in font_name for weight in ['Regular', 'Medium', 'SemiBold', 'Bold', 'ExtraBold']):
-                        if 'Italic' not in font_name:
-                            data = zip_ref.read(file)
-                            dest_path = FONTS_DIR / font_name
-                            with open(dest_path, 'wb') as f:
-                                f.write(data)
-                            print(f"  Extracted: {font_name}")
+            # Extract only the static TTF files we need
+            members = [file for file in zip_ref.namelist() if WANTED_MEMBER_RE.search(file)]
+        
+        # zlib inflate and file writes release the GIL, so fonts extract in parallel
+        with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as executor:
+            extracted = list(executor.map(lambda member: extract_font(zip_path, member), members))
+        print(f"  Extracted: {', '.join(extracted)}")
+        
+        if WANTED_FONTS <= list_dir(FONTS_DIR):
+            FONTS_SENTINEL.write_bytes(b"")
         
         # Clean up
         zip_path.unlink()
@@ -63,46 +119,45 @@ def download_fonts():
 
 def check_assets():
     """Check required assets and provide instructions."""
-    print("\nAsset Status:")
+    lines = ["\nAsset Status:"]
+    assets_present = list_dir(ASSETS_DIR)
     
     # Check background
-    bg_path = ASSETS_DIR / "background.png"
-    if bg_path.exists():
-        print("✓ background.png found")
+    bg_found = "background.png" in assets_present
+    if bg_found:
+        lines.append("✓ background.png found")
     else:
-        print("✗ background.png MISSING")
-        print("  → Place your black marble texture image at: assets/background.png")
+        lines.append("✗ background.png MISSING")
+        lines.append("  → Place your black marble texture image at: assets/background.png")
     
     # Check logo
-    logo_path = ASSETS_DIR / "logo.png"
-    if logo_path.exists():
-        print("✓ logo.png found")
+    logo_found = "logo.png" in assets_present
+    if logo_found:
+        lines.append("✓ logo.png found")
     else:
-        print("✗ logo.png MISSING")
-        print("  → Place your STRUCTURE logo at: assets/logo.png")
-    
-    # Check fonts
-    required_fonts = [
-        "Montserrat-Regular.ttf",
-        "Montserrat-Medium.ttf",
-        "Montserrat-SemiBold.ttf",
-        "Montserrat-Bold.ttf",
-        "Montserrat-ExtraBold.ttf",
-    ]
+        lines.append("✗ logo.png MISSING")
+        lines.append("  → Place your STRUCTURE logo at: assets/logo.png")
     
+    # Check fonts (the sentinel means a previous run installed all of them)
     missing_fonts = []
-    for font in required_fonts:
-        if (FONTS_DIR / font).exists():
-            print(f"✓ {font} found")
-        else:
-            missing_fonts.append(font)
-            print(f"✗ {font} MISSING")
+    if FONTS_SENTINEL.exists():
+        lines.append("✓ Montserrat fonts installed")
+    else:
+        fonts_present = list_dir(FONTS_DIR)
+        for font in REQUIRED_FONTS:
+            if font in fonts_present:
+                lines.append(f"✓ {font} found")
+            else:
+                missing_fonts.append(font)
+                lines.append(f"✗ {font} MISSING")
     
     if missing_fonts:
-        print(f"\n  → Download fonts from: https://fonts.google.com/specimen/Montserrat")
-        print(f"  → Place TTF files in: {FONTS_DIR}")
+        lines.append(f"\n  → Download fonts from: https://fonts.google.com/specimen/Montserrat")
+        lines.append(f"  → Place TTF files in: {FONTS_DIR}")
     
-    return bg_path.exists() and logo_path.exists() and not missing_fonts
+    # One write for the whole report
+    print("\n".join(lines))
+    return bg_found and logo_found and not missing_fonts
 
 
 def main():
@@ -13,14 +13,23 @@ Or with custom settings:
 """
 
 import argparse
+import csv
+import gzip
+import importlib.util
 import json
 import logging
 import os
+import queue
+import re
+import signal
 import sys
+import threading
 import time
 import tempfile
+import uuid
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -33,6 +42,25 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "requests"])
     import requests
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes (a response body or file contents), using orjson when available."""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode compact JSON bytes, using orjson when available."""
+    return orjson.dumps(obj) if HAS_ORJSON else json.dumps(obj, separators=(',', ':')).encode()
+
 # Setup logging with colors
 class ColoredFormatter(logging.Formatter):
     COLORS = {
@@ -44,73 +72,242 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, use_color: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names are built once here rather than on every record
+        self._level_map = {
+            level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()
+        } if use_color else {}
+    
     def format(self, record):
-        color = self.COLORS.get(record.levelname, '')
-        record.levelname = f"{color}{record.levelname}{self.RESET}"
+        record.levelname = self._level_map.get(record.levelname, record.levelname)
         return super().format(record)
 
-# Configure logging
+# Configure logging (no escape codes when stderr is redirected to a file or log collector)
 handler = logging.StreamHandler()
 handler.setFormatter(ColoredFormatter(
     '%(asctime)s │ %(levelname)s │ %(message)s',
-    datefmt='%H:%M:%S'
+    datefmt='%H:%M:%S',
+    use_color=handler.stream.isatty(),
 ))
 logging.basicConfig(level=logging.INFO, handlers=[handler])
 logger = logging.getLogger(__name__)
 
 
+# Keywords that make a transcript moment likely to go viral, by category
+VIRAL_KEYWORDS = {
+    "controversial": ["actually", "wrong", "truth", "secret", "nobody", "everyone", "always", "never"],
+    "emotional": ["amazing", "incredible", "love", "hate", "worst", "best", "changed", "life"],
+    "educational": ["how to", "why", "because", "learn", "tip", "hack", "strategy"],
+    "funny": ["literally", "imagine", "wait", "hilarious", "crazy", "insane"],
+}
+VIRAL_KEYWORD_ORDER = tuple((cat, kw) for cat, keywords in VIRAL_KEYWORDS.items() for kw in keywords)
+# Zero-width lookahead so overlapping matches are all found, like separate `kw in text` checks
+VIRAL_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(sorted((re.escape(kw) for _, kw in VIRAL_KEYWORD_ORDER), key=len, reverse=True)) + "))"
+)
+
+
+class UploadError(Exception):
+    """The server did not accept an upload, even after the session adapter's retries."""
+
+
+class PermanentUploadError(UploadError):
+    """The server rejected an upload with a 4xx - sending the same request again cannot succeed."""
+
+
+class MultipartFileBody:
+    """
+    multipart/form-data body that streams one file from disk.
+    
+    requests sends any iterable chunk by chunk, and __len__ lets it set Content-Length
+    up front. Each iteration re-opens the file, so adapter retries resend the whole body.
+    """
+    CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self, fields: dict, file_field: str, path: Path, file_type: str):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self.path = path
+        self.head = "".join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+            for name, value in fields.items()
+        ).encode() + (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{path.name}"\r\n'
+            f'Content-Type: {file_type}\r\n\r\n'
+        ).encode()
+        self.tail = f"\r\n--{boundary}--\r\n".encode()
+    
+    def __len__(self):
+        return len(self.head) + self.path.stat().st_size + len(self.tail)
+    
+    def __iter__(self):
+        yield self.head
+        with open(self.path, 'rb') as f:
+            while chunk := f.read(self.CHUNK_SIZE):
+                yield chunk
+        yield self.tail
+
+
 def check_ffmpeg():
-    """Check if FFmpeg is installed."""
-    try:
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True)
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    """Check if FFmpeg is installed (a PATH lookup - no process is started)."""
+    return shutil.which('ffmpeg') is not None
 
 
 def check_yt_dlp():
-    """Check if yt-dlp is installed."""
+    """Check if the yt-dlp module is installed, without importing it (the import is slow)."""
+    return importlib.util.find_spec('yt_dlp') is not None
+
+
+# Video encoder flags at roughly libx264 -crf 23 quality, in order of preference
+VIDEO_ENCODERS = {
+    'h264_nvenc': ['-c:v', 'h264_nvenc', '-preset', 'p5', '-rc', 'vbr', '-cq', '23'],
+    'h264_qsv': ['-c:v', 'h264_qsv', '-preset', 'medium', '-global_quality', '23'],
+    'h264_vaapi': ['-c:v', 'h264_vaapi', '-qp', '23'],
+    'libx264': ['-c:v', 'libx264', '-preset', 'fast', '-crf', '23'],
+}
+VAAPI_DEVICE = '/dev/dri/renderD128'
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (respects taskset/container CPU affinity where the OS supports it)."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def encoder_parallelism(encoder: str, cpus: int) -> int:
+    """How many FFmpeg encodes to run at once with `encoder` on `cpus` CPUs."""
+    if encoder == 'h264_nvenc':
+        return 2  # Consumer GeForce cards allow only a few concurrent NVENC sessions
+    if encoder == 'h264_vaapi':
+        return 1  # One shared render device
+    if encoder == 'h264_qsv':
+        return 2
+    # libx264 keeps ~4 cores busy per encode
+    return max(1, cpus // 4)
+
+
+def detect_hw_encoder() -> str:
+    """Pick the first hardware H.264 encoder that FFmpeg lists and can actually open, else libx264."""
     try:
-        result = subprocess.run(['yt-dlp', '--version'], capture_output=True, text=True)
-        return result.returncode == 0
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'], capture_output=True, text=True)
     except FileNotFoundError:
-        return False
+        return 'libx264'
+    
+    for encoder in ('h264_nvenc', 'h264_qsv', 'h264_vaapi'):
+        if encoder not in result.stdout:
+            continue
+        # Builds list encoders for hardware that may not be present - try a tiny encode
+        cmd = ['ffmpeg', '-hide_banner', '-v', 'error']
+        if encoder == 'h264_vaapi':
+            cmd.extend(['-vaapi_device', VAAPI_DEVICE])
+        cmd.extend(['-f', 'lavfi', '-i', 'color=c=black:s=256x256:d=0.1'])
+        if encoder == 'h264_vaapi':
+            cmd.extend(['-vf', 'format=nv12,hwupload'])
+        cmd.extend(VIDEO_ENCODERS[encoder] + ['-f', 'null', '-'])
+        if subprocess.run(cmd, capture_output=True).returncode == 0:
+            return encoder
+    return 'libx264'
+
+
+def pick_whisper_device() -> tuple:
+    """Pick the faster-whisper (device, compute_type): CUDA float16 if a GPU is visible, else CPU int8."""
+    try:
+        import ctranslate2  # faster-whisper's inference backend
+        if ctranslate2.get_cuda_device_count() > 0:
+            return "cuda", "float16"
+    except Exception:
+        pass
+    return "cpu", "int8"
 
 
 class LocalWorker:
     """Local worker that processes video jobs from a remote server."""
     
+    LONG_POLL_WAIT = 25  # Seconds the server may hold a pending-job request open
+    PROGRESS_MIN_DELTA = 0.01  # Skip progress POSTs that move less than 1%...
+    PROGRESS_MIN_INTERVAL = 0.5  # ...unless this many seconds passed since the last one
+    WHISPER_CACHE_SIZE = 2  # Whisper models kept loaded between jobs
+    WORK_DIR_CAP_BYTES = 20 * 1024**3  # Evict old job directories beyond this much disk
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # Video download read/write size
+    FFMPEG_LOG_TAIL = 2048  # Bytes of FFmpeg's stderr log kept for error messages
+    FFMPEG_STOP_TIMEOUT = 5  # Seconds FFmpeg gets to exit after SIGTERM before it is killed
+    UPLOAD_WORKERS = 4  # Clips uploaded concurrently
+    SEGMENT_LIST = "segments.csv"  # Real clip boundaries written by stream-copy splits
+    GZIP_MIN_BYTES = 1024  # JSON bodies smaller than this are not worth compressing
+    
     def __init__(self, server_url: str, worker_id: str = None):
         self.server_url = server_url.rstrip('/')
         self.worker_id = worker_id or f"worker-{os.getpid()}"
         self.api_base = f"{self.server_url}/api/clipper"
+        self._jobs_base = f"{self.api_base}/worker/jobs"  # See _job_url
         self.running = True
         self.current_job = None
         
+        # Last progress update actually queued (see update_job_progress)
+        self._last_progress_pct = -1.0
+        self._last_progress_ts = 0.0
+        self._last_progress_stage = None
+        
+        # Progress POSTs go through a background thread; it sets _stop_event on cancellation
+        self._progress_q = queue.Queue(maxsize=8)
+        self._stop_event = threading.Event()
+        self._progress_thread = threading.Thread(target=self._progress_loop, daemon=True)
+        
+        # One pooled session for every call - keeps the TLS connection to the server alive
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['GET', 'POST']),
+            ),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers["User-Agent"] = f"clipper-local-worker/{self.worker_id}"
+        self._progress_thread.start()
+        
         # Create temp directory for processing
         self.work_dir = Path(tempfile.gettempdir()) / "clipper_worker"
         self.work_dir.mkdir(exist_ok=True)
         
+        self._cpus = available_cpus()
+        self._whisper_device, self._whisper_ctype = pick_whisper_device()
+        self._hw_encoder = detect_hw_encoder()
+        
+        # Whisper loads on a background thread so it overlaps the video download
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._whisper_future = None
+        self._whisper_cache = {}  # (name, device, compute_type) -> model, oldest first
+        
+        # Finished job directories are deleted off the main loop
+        self._cleanup_executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Running FFmpeg processes, so a shutdown signal can stop them too
+        self._children = set()
+        
         logger.info(f"🖥️  Local Worker initialized")
         logger.info(f"📡 Server: {self.server_url}")
         logger.info(f"🆔 Worker ID: {self.worker_id}")
         logger.info(f"📁 Work directory: {self.work_dir}")
-    
-    def check_server(self) -> bool:
-        """Check if the server is reachable."""
-        try:
-            resp = requests.get(f"{self.api_base}/status", timeout=10)
-            data = resp.json()
-            logger.info(f"✅ Server connected - Status: {data.get('status', 'unknown')}")
-            return True
-        except Exception as e:
-            logger.error(f"❌ Cannot connect to server: {e}")
-            return False
+        logger.info(f"🎙️  Whisper device: {self._whisper_device} ({self._whisper_ctype})")
+        logger.info(f"🎞️  Video encoder: {self._hw_encoder}")
+        logger.info(f"🧮 CPUs: {self._cpus}")
     
     def register_worker(self) -> bool:
-        """Register this worker with the server."""
+        """
+        Register this worker with the server.
+        
+        Doubles as the startup connectivity check: returns False only if the server
+        could not be reached at all.
+        """
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 f"{self.api_base}/worker/register",
                 json={
                     "worker_id": self.worker_id,
@@ -119,50 +316,117 @@ class LocalWorker:
                 },
                 timeout=10
             )
+            logger.info(f"✅ Server connected")
             if resp.status_code == 200:
                 logger.info(f"✅ Worker registered with server")
-                return True
             else:
                 logger.warning(f"⚠️  Worker registration returned {resp.status_code}")
-                return True
-        except Exception as e:
-            logger.warning(f"⚠️  Could not register worker: {e}")
             return True
+        except requests.exceptions.RequestException as e:
+            logger.error(f"❌ Cannot connect to server: {e}")
+            return False
+    
+    def _post_json(self, url: str, obj, timeout: float = 30) -> requests.Response:
+        """POST compact JSON, gzipped once it is large enough for that to pay off."""
+        payload = _json_dumps(obj)
+        if len(payload) >= self.GZIP_MIN_BYTES:
+            resp = self.session.post(
+                url,
+                data=gzip.compress(payload, compresslevel=6),
+                headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+                timeout=timeout
+            )
+            if resp.status_code not in (400, 422):
+                return resp
+            # Server predates gzip support - resend uncompressed
+        return self.session.post(
+            url, data=payload, headers={"Content-Type": "application/json"}, timeout=timeout
+        )
+    
+    def _job_url(self, job_id: str, action: str) -> str:
+        """URL of a per-job worker endpoint, e.g. _job_url(id, "complete")."""
+        return f"{self._jobs_base}/{job_id}/{action}"
     
     def fetch_pending_job(self) -> Optional[dict]:
-        """Fetch a pending job from the server."""
+        """Fetch a pending job from the server (long-polls for up to LONG_POLL_WAIT seconds)."""
         try:
-            resp = requests.get(
-                f"{self.api_base}/worker/jobs/pending",
-                params={"worker_id": self.worker_id},
-                timeout=10
+            resp = self.session.get(
+                f"{self._jobs_base}/pending",
+                params={"worker_id": self.worker_id, "wait": self.LONG_POLL_WAIT},
+                timeout=(10, self.LONG_POLL_WAIT + 5)
             )
             if resp.status_code == 200:
-                data = resp.json()
+                data = _json_loads(resp.content)
                 if data.get("job"):
                     return data["job"]
             return None
+        except requests.exceptions.ReadTimeout:
+            # Expected when the long poll runs out without a job
+            return None
         except Exception as e:
             logger.debug(f"No pending jobs or error: {e}")
             return None
     
-    def update_job_progress(self, job_id: str, progress: float, stage: str, detail: str = None):
-        """Update job progress on the server."""
+    def update_job_progress(self, job_id: str, progress: float, stage: str, detail: str = None, force: bool = False):
+        """
+        Queue a job progress update for the server; returns whether the job should stop.
+        
+        Updates are coalesced: within the same stage one is only queued once progress
+        moved PROGRESS_MIN_DELTA or PROGRESS_MIN_INTERVAL seconds passed. The POST itself
+        happens on the progress thread, so callers never wait on the network.
+        """
+        now = time.monotonic()
+        if (
+            not force
+            and stage == self._last_progress_stage
+            and abs(progress - self._last_progress_pct) < self.PROGRESS_MIN_DELTA
+            and now - self._last_progress_ts < self.PROGRESS_MIN_INTERVAL
+        ):
+            return self._stop_event.is_set()
+        
+        self._last_progress_pct = progress
+        self._last_progress_ts = now
+        self._last_progress_stage = stage
+        
+        update = (job_id, {
+            "worker_id": self.worker_id,
+            "progress": progress,
+            "stage": stage,
+            "detail": detail or "",
+        })
         try:
-            resp = requests.post(
-                f"{self.api_base}/worker/jobs/{job_id}/progress",
-                json={
-                    "worker_id": self.worker_id,
-                    "progress": progress,
-                    "stage": stage,
-                    "detail": detail or "",
-                },
-                timeout=5
-            )
-            return resp.json().get("should_stop", False)
-        except Exception as e:
-            logger.debug(f"Could not update progress: {e}")
-            return False
+            self._progress_q.put_nowait(update)
+        except queue.Full:
+            # Drop the oldest update - progress must never hold up processing
+            try:
+                self._progress_q.get_nowait()
+                self._progress_q.task_done()
+            except queue.Empty:
+                pass
+            self._progress_q.put_nowait(update)
+        
+        return self._stop_event.is_set()
+    
+    def _progress_loop(self):
+        """Send queued progress updates (runs on the progress thread)."""
+        while True:
+            job_id, payload = self._progress_q.get()
+            try:
+                resp = self.session.post(
+                    self._job_url(job_id, "progress"),
+                    json=payload,
+                    timeout=5
+                )
+                if _json_loads(resp.content).get("should_stop", False) and job_id == self.current_job:
+                    self._stop_event.set()
+            except Exception as e:
+                logger.debug(f"Could not update progress: {e}")
+            finally:
+                self._progress_q.task_done()
+    
+    def flush_progress(self):
+        """Wait until every queued progress update has been sent."""
+        self._progress_q.join()
     
     def download_video(self, job_id: str, video_url: str = None, youtube_url: str = None) -> Path:
         """Download video to local work directory."""
@@ -175,15 +439,20 @@ class LocalWorker:
         if video_url:
             logger.info(f"⬇️  Fetching video from Railway (already downloaded)...")
             full_url = video_url if video_url.startswith('http') else f"{self.server_url}{video_url}"
-            resp = requests.get(full_url, stream=True, timeout=600)
+            # The video is already compressed - ask for it as-is so nothing is decoded per chunk
+            resp = self.session.get(
+                full_url, stream=True, timeout=600, headers={"Accept-Encoding": "identity"}
+            )
             resp.raise_for_status()
             
             total_size = int(resp.headers.get('content-length', 0))
             downloaded = 0
             last_log = 0
             
-            with open(video_path, 'wb') as f:
-                for chunk in resp.iter_content(chunk_size=65536):  # 64KB chunks for speed
+            with open(video_path, 'wb', buffering=self.DOWNLOAD_CHUNK_SIZE) as f:
+                for chunk in resp.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                    if self._stop_event.is_set():
+                        raise Exception("Job cancelled")
                     f.write(chunk)
                     downloaded += len(chunk)
                     if total_size > 0:
@@ -256,6 +525,29 @@ class LocalWorker:
                     candidate.rename(output_path)
                 break
     
+    def _load_whisper(self, name: str):
+        """Load a faster-whisper model on this worker's device, reusing recently loaded ones."""
+        key = (name, self._whisper_device, self._whisper_ctype)
+        model = self._whisper_cache.pop(key, None)
+        if model is not None:
+            self._whisper_cache[key] = model  # Re-insert as most recently used
+            return model
+        
+        from faster_whisper import WhisperModel
+        
+        logger.info(f"   Loading Whisper model '{name}'...")
+        if self._whisper_device == "cuda":
+            model = WhisperModel(name, device="cuda", compute_type=self._whisper_ctype)
+        else:
+            # Use every core for the int8 kernels
+            model = WhisperModel(name, device="cpu", compute_type=self._whisper_ctype,
+                                 cpu_threads=self._cpus)
+        if len(self._whisper_cache) >= self.WHISPER_CACHE_SIZE:
+            # Evict the least recently used model
+            self._whisper_cache.pop(next(iter(self._whisper_cache)))
+        self._whisper_cache[key] = model
+        return model
+    
     def process_smart_job(self, job_id: str, video_path: Path, config: dict) -> dict:
         """Process a smart job: transcribe, analyze for viral moments, return candidates."""
         job_dir = self.work_dir / job_id
@@ -275,11 +567,10 @@ class LocalWorker:
         self.update_job_progress(job_id, 0.1, "Transcribing audio", f"Using Whisper {whisper_model} model on your PC...")
         
         try:
-            # Try to use faster-whisper
-            from faster_whisper import WhisperModel
-            
-            logger.info(f"   Loading Whisper model '{whisper_model}'...")
-            model = WhisperModel(whisper_model, device="cpu", compute_type="int8")
+            # Usually already loading since the job started (see process_job)
+            future = self._whisper_future or self._executor.submit(self._load_whisper, whisper_model)
+            self._whisper_future = None
+            model = future.result()
             
             logger.info(f"   Transcribing...")
             segments_gen, info = model.transcribe(
@@ -297,6 +588,8 @@ class LocalWorker:
             
             total_duration = info.duration
             for seg in segments_gen:
+                if self._stop_event.is_set():
+                    raise Exception("Job cancelled")
                 words = []
                 if seg.words:
                     for w in seg.words:
@@ -326,8 +619,7 @@ class LocalWorker:
             
             # Save transcript
             transcript_path = job_dir / "transcript.json"
-            with open(transcript_path, "w") as f:
-                json.dump(transcript, f, indent=2)
+            transcript_path.write_bytes(_json_dumps(transcript))
             
         except ImportError:
             logger.error("faster-whisper not installed!")
@@ -355,17 +647,18 @@ class LocalWorker:
         
         # Save candidates
         candidates_path = job_dir / "viral_candidates.json"
-        with open(candidates_path, "w") as f:
-            json.dump(candidates, f, indent=2)
+        candidates_path.write_bytes(_json_dumps(candidates))
         
         # Upload candidates to server
         self.update_job_progress(job_id, 0.9, "Uploading results", "Sending candidates to server...")
+        # Candidates move the job to 'analyzed' - no progress update may land after them
+        self.flush_progress()
         
         try:
-            resp = requests.post(
-                f"{self.api_base}/worker/jobs/{job_id}/candidates",
-                json={"candidates": candidates, "transcript": transcript},
-                timeout=30
+            # Word-level transcripts are large and repetitive - _post_json gzips them
+            resp = self._post_json(
+                self._job_url(job_id, "candidates"),
+                {"candidates": candidates, "transcript": transcript},
             )
             if resp.status_code == 200:
                 logger.info(f"   ✓ Candidates uploaded to server")
@@ -384,37 +677,32 @@ class LocalWorker:
     def _analyze_viral_moments(self, words: list, num_clips: int, min_duration: float, max_duration: float) -> list:
         """Analyze transcript for viral moments using heuristics or GPT."""
         
-        # Build sentences from words
+        # Build sentences from words (collect word texts, join once per sentence)
         sentences = []
-        current_sentence = {"start": 0, "end": 0, "text": "", "words": []}
+        current_sentence = {"start": 0, "end": 0, "words": []}
+        parts = []
         
         for word in words:
             word_text = word.get("word", "")
             current_sentence["words"].append(word)
-            current_sentence["text"] += word_text + " "
+            parts.append(word_text)
             current_sentence["end"] = word.get("end", 0)
             
             if not current_sentence["start"]:
                 current_sentence["start"] = word.get("start", 0)
             
-            if any(word_text.rstrip().endswith(p) for p in ['.', '!', '?']):
-                current_sentence["text"] = current_sentence["text"].strip()
+            if word_text.rstrip().endswith(('.', '!', '?')):
+                current_sentence["text"] = " ".join(parts).strip()
                 if current_sentence["text"]:
                     sentences.append(current_sentence)
-                current_sentence = {"start": 0, "end": 0, "text": "", "words": []}
+                current_sentence = {"start": 0, "end": 0, "words": []}
+                parts = []
         
-        if current_sentence["text"].strip():
-            current_sentence["text"] = current_sentence["text"].strip()
+        text = " ".join(parts).strip()
+        if text:
+            current_sentence["text"] = text
             sentences.append(current_sentence)
         
-        # Score sentences
-        viral_keywords = {
-            "controversial": ["actually", "wrong", "truth", "secret", "nobody", "everyone", "always", "never"],
-            "emotional": ["amazing", "incredible", "love", "hate", "worst", "best", "changed", "life"],
-            "educational": ["how to", "why", "because", "learn", "tip", "hack", "strategy"],
-            "funny": ["literally", "imagine", "wait", "hilarious", "crazy", "insane"],
-        }
-        
         # Create segments of appropriate length
         moments = []
         i = 0
@@ -432,6 +720,10 @@ class LocalWorker:
             
             duration = segment_end - segment_start
             if duration < min_duration:
+                if j == len(sentences):
+                    # Ran out of transcript: with Whisper's monotonic timestamps every later
+                    # start is even closer to the end, so no further segment can be long enough
+                    break
                 i += 1
                 continue
             
@@ -448,12 +740,13 @@ class LocalWorker:
             reasons = []
             text_lower = text.lower()
             
-            for cat, keywords in viral_keywords.items():
-                for kw in keywords:
-                    if kw in text_lower:
-                        score += 5
-                        category = cat
-                        reasons.append(f"Contains '{kw}'")
+            # One regex pass finds every keyword present; score them in table order
+            found = set(VIRAL_KEYWORD_RE.findall(text_lower))
+            for cat, kw in VIRAL_KEYWORD_ORDER:
+                if kw in found:
+                    score += 5
+                    category = cat
+                    reasons.append(f"Contains '{kw}'")
             
             if "?" in text:
                 score += 10
@@ -494,21 +787,200 @@ class LocalWorker:
         
         return moments[:num_clips * 3]  # Return more candidates than needed
     
+    def _probe(self, job_id: str, video_path: Path) -> dict:
+        """ffprobe format + stream metadata for a job's video, cached as probe.json in the job dir."""
+        cache_path = self.work_dir / job_id / "probe.json"
+        if cache_path.exists():
+            return _json_loads(cache_path.read_bytes())
+        
+        result = subprocess.run(
+            [
+                'ffprobe', '-v', 'error',
+                '-print_format', 'json',
+                '-show_format', '-show_streams',
+                str(video_path)
+            ],
+            capture_output=True, check=True
+        )
+        cache_path.write_bytes(result.stdout)
+        return _json_loads(result.stdout)
+    
+    def _clips_command(self, video_path: Path, clips_dir: Path, spans: list, crop_vertical: bool,
+                       first_index: int = 1, threads: int = 0, has_audio: bool = True) -> list:
+        """
+        Build one FFmpeg command that writes every clip in `spans` ((start, end) pairs).
+        
+        Clips are numbered from `first_index` (clip_01.mp4, clip_02.mp4, ...). A re-encode
+        uses `threads` decoder/encoder threads (0 lets FFmpeg pick from the core count).
+        """
+        if not crop_vertical:
+            # No filter needed - split with the segment muxer and stream-copy (no re-encode).
+            # Cuts snap to the nearest keyframes, so the real boundaries go to SEGMENT_LIST.
+            if len(spans) > 1:
+                split_at = ['-segment_times', ','.join(str(start) for start, _ in spans[1:])]
+            else:
+                split_at = ['-segment_time', str(spans[-1][1] + 1)]  # Longer than the clip: no split
+            return [
+                'ffmpeg', '-y', '-v', 'error',
+                '-i', str(video_path),
+                '-t', str(spans[-1][1]),
+                '-map', '0:v:0', '-map', '0:a:0?',
+                '-c', 'copy',
+                '-f', 'segment',
+                *split_at,
+                '-segment_start_number', '1',
+                '-segment_list', str(clips_dir / self.SEGMENT_LIST),
+                '-segment_list_type', 'csv',
+                '-segment_format_options', 'movflags=+faststart',
+                '-reset_timestamps', '1',
+                str(clips_dir / 'clip_%02d.mp4'),
+            ]
+        
+        # Cropping needs a re-encode: one decode of the input feeds an output per clip
+        encoder = self._hw_encoder
+        cmd = ['ffmpeg', '-y', '-v', 'error', '-threads', str(threads)]
+        if encoder == 'h264_vaapi':
+            cmd.extend(['-vaapi_device', VAAPI_DEVICE])
+        # Seek the input to the first clip and stop it after the last, so only this
+        # group's range is decoded (input timestamps then start at 0 from `seek`)
+        seek = spans[0][0]
+        if seek > 0:
+            cmd.extend(['-ss', str(seek)])
+        cmd.extend(['-t', str(spans[-1][1] - seek), '-i', str(video_path)])
+        
+        # Crop to 9:16 vertical
+        video_filter = 'crop=ih*9/16:ih,scale=1080:1920'
+        if encoder == 'h264_vaapi':
+            # VAAPI encodes from GPU surfaces - upload the filtered frames
+            video_filter += ',format=nv12,hwupload'
+        
+        # Split the decoded stream into one branch per clip and trim each branch *before*
+        # cropping and scaling, so every frame is filtered once for the clip it belongs to
+        n = len(spans)
+        graph = [f"[0:v:0]split={n}" + "".join(f"[v{i}]" for i in range(n))]
+        if has_audio:
+            graph.append(f"[0:a:0]asplit={n}" + "".join(f"[a{i}]" for i in range(n)))
+        for i, (start_time, end_time) in enumerate(spans):
+            trim = f"start={start_time - seek}:end={end_time - seek}"
+            graph.append(f"[v{i}]trim={trim},setpts=PTS-STARTPTS,{video_filter}[vout{i}]")
+            if has_audio:
+                graph.append(f"[a{i}]atrim={trim},asetpts=PTS-STARTPTS[aout{i}]")
+        cmd.extend(['-filter_complex', ';'.join(graph)])
+        
+        for i in range(n):
+            cmd.extend(['-map', f'[vout{i}]'])
+            if has_audio:
+                cmd.extend(['-map', f'[aout{i}]'])
+            cmd.extend(['-threads', str(threads)])
+            cmd.extend(VIDEO_ENCODERS[encoder])
+            cmd.extend([
+                '-c:a', 'aac',
+                '-b:a', '128k',
+                '-movflags', '+faststart',
+                str(clips_dir / f"clip_{first_index + i:02d}.mp4"),
+            ])
+        return cmd
+    
+    def _clips_commands(self, video_path: Path, clips_dir: Path, spans: list, crop_vertical: bool,
+                        has_audio: bool = True) -> list:
+        """
+        Split the clips across FFmpeg commands that can run at the same time.
+        
+        Stream copies are disk-bound and stay a single command. Re-encodes are split into
+        contiguous groups, one per encoder slot, so each process decodes only its own range.
+        """
+        workers = min(len(spans), encoder_parallelism(self._hw_encoder, self._cpus)) if crop_vertical else 1
+        # Share the CPUs between concurrent runs instead of each one sizing itself to the whole machine
+        threads = max(1, self._cpus // workers)
+        per_group, extra = divmod(len(spans), workers)
+        cmds = []
+        start = 0
+        for g in range(workers):
+            end = start + per_group + (1 if g < extra else 0)
+            cmds.append(self._clips_command(
+                video_path, clips_dir, spans[start:end], crop_vertical, start + 1, threads, has_audio
+            ))
+            start = end
+        return cmds
+    
+    def _run_ffmpeg(self, cmds: list, job_id: str, progress: float, stage: str, log_dir: Path) -> Optional[tuple]:
+        """
+        Run FFmpeg commands concurrently, checking for job cancellation while they work.
+        
+        Returns (returncode, stderr tail) of the first command that failed (or of the last
+        one if all succeeded), or None if the job was cancelled.
+        """
+        log_paths = [log_dir / f"ffmpeg_{i+1}.log" for i in range(len(cmds))]
+        procs = []
+        try:
+            for cmd, log_path in zip(cmds, log_paths):
+                with open(log_path, 'w') as log:
+                    procs.append(subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=log))
+                self._children.add(procs[-1])
+            for proc in procs:
+                while True:
+                    try:
+                        proc.wait(timeout=1)
+                        break
+                    except subprocess.TimeoutExpired:
+                        if self.update_job_progress(job_id, progress, stage, "Processing..."):
+                            return None
+        finally:
+            for proc in procs:
+                self._stop_process(proc)
+                self._children.discard(proc)
+        
+        failed = next((i for i, proc in enumerate(procs) if proc.returncode != 0), len(procs) - 1)
+        # Only the end of the log matters - read its last 2 KB rather than the whole file
+        with open(log_paths[failed], 'rb') as log:
+            log.seek(max(0, log.seek(0, os.SEEK_END) - self.FFMPEG_LOG_TAIL))
+            tail = log.read().decode(errors='replace')
+        return procs[failed].returncode, tail
+    
+    def _stop_process(self, proc: subprocess.Popen):
+        """Ask a child process to exit, killing it if it has not within FFMPEG_STOP_TIMEOUT."""
+        if proc.poll() is not None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=self.FFMPEG_STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    
+    def _handle_signal(self, signum, frame):
+        """SIGTERM handler: stop child FFmpegs and unwind like Ctrl+C."""
+        self.running = False
+        for proc in list(self._children):
+            if proc.poll() is None:
+                proc.terminate()
+        raise KeyboardInterrupt
+    
+    def _read_segment_list(self, list_path: Path, spans: list) -> list:
+        """
+        Real (start, end) of each clip from the segment muxer's CSV list.
+        
+        Clips missing from the list keep their planned span from `spans`.
+        """
+        spans = list(spans)
+        try:
+            with open(list_path, newline='') as f:
+                for name, start, end in csv.reader(f):
+                    index = int(name[len('clip_'):-len('.mp4')])
+                    if 1 <= index <= len(spans):
+                        spans[index - 1] = (float(start), float(end))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read clip boundaries, reporting planned ones: {e}")
+        return spans
+    
     def process_video_ffmpeg(self, job_id: str, video_path: Path, config: dict) -> dict:
         """Process video using FFmpeg directly (simple mode without Whisper)."""
         job_dir = self.work_dir / job_id
         clips_dir = job_dir / "clips"
         clips_dir.mkdir(exist_ok=True)
         
-        # Get video duration
-        probe_cmd = [
-            'ffprobe', '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            str(video_path)
-        ]
-        result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        total_duration = float(result.stdout.strip())
+        meta = self._probe(job_id, video_path)
+        total_duration = float(meta['format']['duration'])
         
         logger.info(f"📹 Video duration: {total_duration:.1f}s")
         
@@ -517,6 +989,12 @@ class LocalWorker:
         max_dur = config.get('max_duration', 60)
         crop_vertical = config.get('crop_vertical', True)
         
+        video_stream = next((st for st in meta.get('streams', []) if st.get('codec_type') == 'video'), {})
+        has_audio = any(st.get('codec_type') == 'audio' for st in meta.get('streams', []))
+        if crop_vertical and (video_stream.get('width'), video_stream.get('height')) == (1080, 1920):
+            # Already 1080x1920 - crop and scale would be no-ops, so skip the re-encode
+            crop_vertical = False
+        
         # Calculate segment duration
         segment_duration = total_duration / num_clips
         if segment_duration < min_dur:
@@ -532,64 +1010,50 @@ class LocalWorker:
         
         logger.info(f"🎬 Creating {num_clips} clips of ~{segment_duration:.0f}s each")
         
-        clips = []
+        spans = []
         for i in range(num_clips):
-            # Check for cancellation
-            should_stop = self.update_job_progress(
-                job_id,
-                0.1 + (0.8 * i / num_clips),
-                f"Rendering clip {i+1}/{num_clips}",
-                f"Processing..."
-            )
-            if should_stop:
-                logger.info("⏹️  Job cancelled")
-                return {"success": False, "error": "Cancelled"}
-            
             start_time = i * segment_duration
             end_time = min(start_time + segment_duration, total_duration)
-            duration = end_time - start_time
-            
-            clip_path = clips_dir / f"clip_{i+1:02d}.mp4"
-            
+            spans.append((start_time, end_time))
             logger.info(f"   Clip {i+1}: {start_time:.1f}s - {end_time:.1f}s")
-            
-            # Build FFmpeg command
-            cmd = [
-                'ffmpeg', '-y',
-                '-ss', str(start_time),
-                '-i', str(video_path),
-                '-t', str(duration),
-            ]
-            
-            if crop_vertical:
-                # Crop to 9:16 vertical
-                cmd.extend(['-vf', 'crop=ih*9/16:ih,scale=1080:1920'])
-            
-            cmd.extend([
-                '-c:v', 'libx264',
-                '-preset', 'fast',
-                '-crf', '23',
-                '-c:a', 'aac',
-                '-b:a', '128k',
-                '-movflags', '+faststart',
-                str(clip_path)
-            ])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.error(f"FFmpeg error: {result.stderr[-500:]}")
+        
+        # Clips come out of a few concurrent FFmpeg runs (see _clips_commands)
+        stage = f"Rendering {num_clips} clips"
+        cmds = self._clips_commands(video_path, clips_dir, spans, crop_vertical, has_audio)
+        outcome = self._run_ffmpeg(cmds, job_id, 0.1, stage, job_dir)
+        if outcome and outcome[0] != 0 and crop_vertical and self._hw_encoder != 'libx264':
+            # Hardware encoders can reject some inputs - fall back to software from here on
+            logger.warning(f"{self._hw_encoder} failed, falling back to libx264")
+            self._hw_encoder = 'libx264'
+            cmds = self._clips_commands(video_path, clips_dir, spans, crop_vertical, has_audio)
+            outcome = self._run_ffmpeg(cmds, job_id, 0.1, stage, job_dir)
+        
+        if outcome is None:
+            logger.info("⏹️  Job cancelled")
+            return {"success": False, "error": "Cancelled"}
+        if outcome[0] != 0:
+            logger.error(f"FFmpeg error: {outcome[1]}")
+        
+        if not crop_vertical:
+            # Stream-copy cuts land on keyframes - report where each clip really starts and ends
+            spans = self._read_segment_list(clips_dir / self.SEGMENT_LIST, spans)
+        
+        clips = []
+        for i, (start_time, end_time) in enumerate(spans):
+            clip_path = clips_dir / f"clip_{i+1:02d}.mp4"
+            if not clip_path.exists() or clip_path.stat().st_size == 0:
                 continue
-            
             clips.append({
                 "index": i + 1,
                 "path": str(clip_path),
                 "start_time": start_time,
                 "end_time": end_time,
-                "duration": duration,
+                "duration": end_time - start_time,
                 "score": 1.0,
                 "text": f"Clip {i+1}"
             })
         
+        self.update_job_progress(job_id, 0.9, stage, f"{len(clips)} clips rendered", force=True)
         return {"success": True, "clips": clips}
     
     def process_job(self, job: dict) -> dict:
@@ -612,12 +1076,25 @@ class LocalWorker:
         logger.info(f"⚙️  Config: {json.dumps(config, indent=2)}")
         
         self.current_job = job_id
+        self._last_progress_stage = None
+        self._stop_event.clear()
+        self._whisper_future = None
+        try:
+            self._evict_work_dir()
+        except OSError as e:
+            logger.warning(f"Could not evict old job directories: {e}")
         job_dir = self.work_dir / job_id
         job_dir.mkdir(exist_ok=True)
         
         start_time = datetime.now()
         
         try:
+            if job_type == "smart":
+                # Start loading Whisper now - it only needs the model name, not the video
+                self._whisper_future = self._executor.submit(
+                    self._load_whisper, config.get('whisper_model', 'base')
+                )
+            
             # Download video from Railway (already downloaded by Railway)
             video_path = self.download_video(job_id, video_url, youtube_url)
             
@@ -725,24 +1202,29 @@ class LocalWorker:
                 "error": str(e),
             }
         finally:
+            # Results are reported next - let queued progress land first
+            self.flush_progress()
             self.current_job = None
     
+    def _report_failure(self, job_id: str, error: str):
+        """Mark a job as failed on the server (best effort)."""
+        try:
+            self._post_json(
+                self._job_url(job_id, "complete"),
+                {
+                    "worker_id": self.worker_id,
+                    "success": False,
+                    "error": error,
+                },
+            )
+            logger.error(f"❌ Reported failure to server: {error}")
+        except Exception as e:
+            logger.error(f"Could not report failure: {e}")
+    
     def upload_results(self, job_id: str, result: dict) -> bool:
         """Upload processing results back to the server."""
         if not result.get("success"):
-            try:
-                requests.post(
-                    f"{self.api_base}/worker/jobs/{job_id}/complete",
-                    json={
-                        "worker_id": self.worker_id,
-                        "success": False,
-                        "error": result.get("error", "Unknown error"),
-                    },
-                    timeout=30
-                )
-                logger.error(f"❌ Reported failure to server: {result.get('error')}")
-            except Exception as e:
-                logger.error(f"Could not report failure: {e}")
+            self._report_failure(job_id, result.get("error", "Unknown error"))
             return False
         
         # Handle smart job results (candidates, not clips)
@@ -760,54 +1242,125 @@ class LocalWorker:
         logger.info(f"⬆️  Uploading {len(clips)} clips to server...")
         
         try:
-            for clip in clips:
-                clip_path = Path(clip["path"])
-                if clip_path.exists():
-                    logger.info(f"   📤 Uploading clip {clip['index']}...")
-                    with open(clip_path, 'rb') as f:
-                        resp = requests.post(
-                            f"{self.api_base}/worker/jobs/{job_id}/upload-clip",
-                            files={"file": (clip_path.name, f, "video/mp4")},
-                            data={
-                                "index": clip["index"],
-                                "start_time": clip["start_time"],
-                                "end_time": clip["end_time"],
-                                "duration": clip["duration"],
-                                "score": clip.get("score", 1.0),
-                                "text": clip.get("text", ""),
-                            },
-                            timeout=120
-                        )
-                        if resp.status_code == 200:
-                            logger.info(f"   ✅ Clip {clip['index']} uploaded")
-                        else:
-                            logger.warning(f"   ⚠️  Clip {clip['index']} upload failed: {resp.status_code}")
+            # Clips are independent - upload a few at once so one clip's round trips
+            # overlap another's transfer (the session pool keeps a connection per thread)
+            with ThreadPoolExecutor(max_workers=self.UPLOAD_WORKERS) as executor:
+                futures = [executor.submit(self._upload_clip, job_id, clip) for clip in clips]
+                try:
+                    uploaded = sum(future.result() for future in futures)
+                except Exception:
+                    # After a failure, don't start the clips still waiting
+                    for future in futures:
+                        future.cancel()
+                    raise
             
             # Mark job complete
-            requests.post(
-                f"{self.api_base}/worker/jobs/{job_id}/complete",
-                json={
+            self._post_json(
+                self._job_url(job_id, "complete"),
+                {
                     "worker_id": self.worker_id,
                     "success": True,
-                    "clips_count": len(clips),
+                    "clips_count": uploaded,
                     "processing_time": result.get("processing_time", 0),
                 },
-                timeout=30
             )
             
             logger.info(f"✅ All results uploaded!")
             return True
             
-        except Exception as e:
+        except UploadError as e:
+            # A clip is missing on the server - fail the job rather than report it complete
+            logger.error(f"❌ {e}")
+            self._report_failure(job_id, str(e))
+            return False
+        except requests.exceptions.RequestException as e:
+            # Transient errors were already retried by the session's adapter
             logger.error(f"❌ Upload failed: {e}")
+            self._report_failure(job_id, f"Upload failed: {e}")
             return False
     
+    def _evict_work_dir(self, cap_bytes: int = None):
+        """Delete the oldest job directories until work_dir fits under cap_bytes.
+        
+        cleanup_job removes a job's files once it finishes, but a crashed or killed
+        worker leaves its job directory behind - this keeps those from piling up.
+        """
+        cap_bytes = self.WORK_DIR_CAP_BYTES if cap_bytes is None else cap_bytes
+        
+        entries = []
+        with os.scandir(self.work_dir) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                size = 0
+                for root, _, files in os.walk(entry.path):
+                    for name in files:
+                        try:
+                            size += os.lstat(os.path.join(root, name)).st_size
+                        except OSError:
+                            pass
+                try:
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                except FileNotFoundError:
+                    continue  # Removed by the cleanup thread meanwhile
+                entries.append((mtime, size, entry.path))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):  # Oldest first
+            if total <= cap_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            logger.info(f"🧹 Evicted old job directory: {path}")
+    
+    def _upload_clip(self, job_id: str, clip: dict) -> bool:
+        """
+        Upload one rendered clip.
+        
+        Returns False if the clip file is gone and raises UploadError if the server did
+        not accept it. 502/503/504 are retried by the session adapter before getting here.
+        """
+        clip_path = Path(clip["path"])
+        if not clip_path.exists():
+            logger.warning(f"   ⚠️  Clip {clip['index']} file missing, skipping: {clip_path}")
+            return False
+        
+        logger.info(f"   📤 Uploading clip {clip['index']}...")
+        # Streamed from disk - the clip is never held in memory
+        body = MultipartFileBody(
+            {
+                "index": clip["index"],
+                "start_time": clip["start_time"],
+                "end_time": clip["end_time"],
+                "duration": clip["duration"],
+                "score": clip.get("score", 1.0),
+                "text": clip.get("text", ""),
+            },
+            "file", clip_path, "video/mp4"
+        )
+        resp = self.session.post(
+            self._job_url(job_id, "upload-clip"),
+            data=body,
+            headers={"Content-Type": body.content_type},
+            timeout=(10, 600)
+        )
+        if resp.status_code == 200:
+            logger.info(f"   ✅ Clip {clip['index']} uploaded")
+            return True
+        if 400 <= resp.status_code < 500:
+            raise PermanentUploadError(f"Clip {clip['index']} rejected: {resp.status_code} {resp.text[:200]}")
+        raise UploadError(f"Clip {clip['index']} upload failed: {resp.status_code} {resp.text[:200]}")
+    
     def cleanup_job(self, job_id: str):
-        """Clean up local files for a completed job."""
+        """Clean up local files for a completed job (runs on the cleanup thread)."""
         job_dir = self.work_dir / job_id
         if job_dir.exists():
-            shutil.rmtree(job_dir)
-            logger.info(f"🧹 Cleaned up: {job_dir}")
+            shutil.rmtree(job_dir, ignore_errors=True)
+            if job_dir.exists():
+                # Left for _evict_work_dir to retry once the work dir grows too large
+                logger.warning(f"Could not fully remove {job_dir}")
+            else:
+                logger.info(f"🧹 Cleaned up: {job_dir}")
     
     def run(self, poll_interval: int = 5):
         """Main worker loop."""
@@ -820,30 +1373,46 @@ class LocalWorker:
         logger.info(f"Press Ctrl+C to stop")
         logger.info(f"")
         
-        if not self.check_server():
+        # One round trip both registers the worker and confirms the server is up
+        if not self.register_worker():
             logger.error("Cannot start - server unreachable")
             return
         
-        self.register_worker()
+        # Service managers stop the worker with SIGTERM - shut down the same way as Ctrl+C
+        signal.signal(signal.SIGTERM, self._handle_signal)
         
         consecutive_errors = 0
+        idle = False  # Whether "Waiting for jobs" has been logged since the last job
+        quick_polls = 0  # Consecutive polls that came back without waiting
         
         while self.running:
             try:
+                poll_started = time.monotonic()
                 job = self.fetch_pending_job()
                 
                 if job:
                     consecutive_errors = 0
+                    idle = False
+                    quick_polls = 0
                     result = self.process_job(job)
                     self.upload_results(job["job_id"], result)
-                    self.cleanup_job(job["job_id"])
+                    # Deleting the job's files can take a while - don't hold up the next poll
+                    self._cleanup_executor.submit(self.cleanup_job, job["job_id"])
                 else:
-                    # No jobs, wait
-                    print(f"\r⏳ Waiting for jobs... (checking every {poll_interval}s)", end="", flush=True)
-                    time.sleep(poll_interval)
+                    if not idle:
+                        logger.info("⏳ Waiting for jobs...")
+                        idle = True
+                    # The long poll already waited on the server; only sleep if it
+                    # came back early (error, or a server without long-poll support),
+                    # backing off while that keeps happening
+                    if time.monotonic() - poll_started < self.LONG_POLL_WAIT / 2:
+                        time.sleep(min(poll_interval * 2 ** min(quick_polls, 4), 60))
+                        quick_polls += 1
+                    else:
+                        quick_polls = 0
                     
             except KeyboardInterrupt:
-                logger.info(f"\n⏹️  Shutting down...")
+                logger.info(f"⏹️  Shutting down...")
                 self.running = False
                 break
             except Exception as e:
@@ -856,10 +1425,14 @@ class LocalWorker:
                 
                 time.sleep(min(poll_interval * consecutive_errors, 60))
         
+        self._cleanup_executor.shutdown(wait=True)
+        self.session.close()
         logger.info(f"👋 Worker stopped")
 
 
 def main():
+    args = parse_args()
+    
     print("""
 ╔══════════════════════════════════════════════════════════════╗
 ║           🎬 VIDEO CLIPPER - LOCAL WORKER                    ║
@@ -883,6 +1456,17 @@ def main():
     else:
         print("✅ yt-dlp found")
     
+    print(f"\n🌐 Connecting to: {args.server}\n")
+    
+    worker = LocalWorker(
+        server_url=args.server,
+        worker_id=args.worker_id,
+    )
+    worker.run(poll_interval=args.poll_interval)
+
+
+def parse_args():
+    # Parsed before any startup checks so --help and usage errors return immediately
     parser = argparse.ArgumentParser(
         description="Local worker for video clipper"
     )
@@ -904,15 +1488,7 @@ def main():
         help="Custom worker ID"
     )
     
-    args = parser.parse_args()
-    
-    print(f"\n🌐 Connecting to: {args.server}\n")
-    
-    worker = LocalWorker(
-        server_url=args.server,
-        worker_id=args.worker_id,
-    )
-    worker.run(poll_interval=args.poll_interval)
+    return parser.parse_args()
 
 
 if __name__ == "__main__":